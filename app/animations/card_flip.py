@@ -10,6 +10,10 @@ from app.animations.animation import Animation
 class CardFlipAnimation(Animation):
     """
     The card flip animation class animates card flips/reveals by scaling the unscaled card sprite horizontally.
+
+    While the card is flipping, the sprite is scaled with the fast nearest neighbor `pygame.transform.scale` instead of
+    `smoothscale`, since the card only stays at each width for a single frame. The card's final image is the unscaled
+    card front itself.
     """
 
     def __init__(self, duration: float, card: "Card",
@@ -24,8 +28,10 @@ class CardFlipAnimation(Animation):
         self.original_width = card.image.get_width()
         self.original_height = card.image.get_height()
 
+        self.last_scaled: tuple[pygame.Surface, int] or None = None  # (Unscaled image, width) of the last scaled image.
+
     def update_anim(self) -> None:
-        w = abs(1 - 2 * self.interpol_phase) * self.original_width
+        w = int(abs(1 - 2 * self.interpol_phase) * self.original_width)
         h = self.original_height
 
         if self.interpol_phase >= 0.5 and not self.card.is_revealed:
@@ -33,9 +39,13 @@ class CardFlipAnimation(Animation):
             self.unscaled_image = self.card.card_front
             self.card.is_revealed = True
 
-        self.card.image = pygame.transform.smoothscale(self.unscaled_image, (w, h))
-        self.card.rect = self.card.image.get_rect(center=self.center)
+        if (self.unscaled_image, w) == self.last_scaled:
+            return  # Same width as the previous frame.
 
+        self.last_scaled = self.unscaled_image, w
+
+        self.card.image = pygame.transform.scale(self.unscaled_image, (w, h))
+        self.card.rect = self.card.image.get_rect(center=self.center)
 
     def finish(self) -> None:
         if not self.card.is_revealed:
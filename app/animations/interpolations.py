@@ -5,6 +5,7 @@ The module that contains interpolation functions: functions that convert the ani
 phase, making animations much more pleasing to look at.
 """
 
+from functools import cache
 from typing import Callable
 
 
@@ -29,4 +30,14 @@ def ease_in(x: float, power: float = 2.0) -> float:
 
 
 def ease_out(x: float, power: float = 2.0) -> float:
-    return (-x * (x - 2)) ** (1 / power)
+    return (x * (2 - x)) ** (1 / power)
+
+
+@cache
+def ease_out_power(power: float) -> InterpolationFunc:
+    """
+    Return an ease out interpolation function with a custom power, to be used in place of `lambda x: ease_out(x, power)`.
+    The reciprocal of the power is calculated once instead of on every call, and the function is cached for each power.
+    """
+    exponent = 1 / power
+    return lambda x: (x * (2 - x)) ** exponent
@@ -15,6 +15,19 @@ from app.widgets.listeners import MouseListener
 from online.client.client_comms import ClientComms
 
 
+FULL_UPDATE_EVENT_TYPES = (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED, pygame.VIDEOEXPOSE)
+"""The types of window events after which the whole display is updated. When the window is uncovered or restored, the
+areas that haven't been drawn on recently would otherwise stay stale until the next scene change."""
+
+HANDLED_EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+                       pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL, pygame.MOUSEMOTION,
+                       *FULL_UPDATE_EVENT_TYPES)
+"""The types of pygame events that are handled in the app's event loop. Other types of events are discarded."""
+
+IDLE_FPS_LIMIT = 30
+"""The FPS limit used while the app is idle: no input, no running animations, and no scheduled timers."""
+
+
 class App:
     def __init__(self):
         pygame.init()
@@ -24,6 +37,7 @@ class App:
         pygame.mixer.set_num_channels(32)
 
         audio.SoundGroup.update_volume()
+        audio.SoundGroup.preload(audio.SoundGroup.get_sfx_filenames())
         audio.MusicPlayer.update_volume(autoplay=False)
 
         ClientComms.app = self
@@ -42,6 +56,7 @@ class App:
         self.clock = pygame.time.Clock()
 
         self.running = True
+        self.idle = False
 
         """
         Side scenes: Background and overlay
@@ -63,6 +78,7 @@ class App:
 
         self.changing_scene = False
         self.reset_next_dt = False
+        self.full_update_next = True  # If set to True then the whole display is updated on the next frame.
 
         """
         Title and icon
@@ -77,7 +93,11 @@ class App:
             """
             Tick
             """
-            dt = self.clock.tick(self.fps_limit) / 1000
+            if self.idle:
+                # Sleep for longer between frames when nothing is happening.
+                dt = self.clock.tick(min(self.fps_limit, IDLE_FPS_LIMIT) or IDLE_FPS_LIMIT) / 1000
+            else:
+                dt = self.clock.tick(self.fps_limit) / 1000
 
             if self.reset_next_dt:
                 dt = 0
@@ -86,7 +106,9 @@ class App:
             """
             Event loop
             """
-            for event in pygame.event.get():
+            events = pygame.event.get(HANDLED_EVENT_TYPES)
+
+            for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
 
@@ -106,19 +128,49 @@ class App:
                 if event.type == pygame.MOUSEMOTION:
                     MouseListener.mouse_x, MouseListener.mouse_y = event.pos
 
+                if event.type in FULL_UPDATE_EVENT_TYPES:
+                    self.full_update_next = True
+
+            pygame.event.clear(pump=False)  # Discard the unhandled events without creating event objects for them.
+
             """
             Updates
             """
             app_timer.default_group.update(dt)
 
-            self.display_surface.fill(self.solid_bg_color)
+            # When the overlay fader is fully opaque, it covers everything behind it, so the solid background color and
+            # the background scene don't need to be drawn.
+            faded_out = self.overlay_scene.fader.image.get_alpha() == 255
+
+            prev_bg_color = self.solid_bg_color
+            if not faded_out:
+                self.display_surface.fill(self.solid_bg_color)
+
+            dirty_rects = []
 
             if self.show_background:
-                self.background_scene.update(dt)
-            self.scene.update(dt)
-            self.overlay_scene.update(dt)
+                dirty_rects += self.background_scene.update(dt, skip_draw=faded_out)
+            dirty_rects += self.scene.update(dt)
+            dirty_rects += self.overlay_scene.update(dt)
+
+            ClientComms.flush_packets()
 
-            pygame.display.update()
+            """
+            Display update
+
+            Only the areas that have been drawn on are updated, unless the whole display has changed (e.g. a scene change,
+            a change of the solid background color, or the window being uncovered or restored).
+            """
+            if self.full_update_next or self.solid_bg_color != prev_bg_color:
+                pygame.display.update()
+                self.full_update_next = False
+
+            elif dirty_rects:
+                pygame.display.update(dirty_rects)
+
+            self.idle = (not events and not app_timer.default_group.timers and
+                         self.scene.idle and self.overlay_scene.idle and
+                         (self.background_scene.idle or not self.show_background))
 
         app_settings.main.save()
         pygame.quit()
@@ -129,6 +181,7 @@ class App:
     def change_scene(self, scene: Scene or str or Callable[[None], Scene], cache_old_scene=True):
         old_scene = self.scene
         self.reset_next_dt = True
+        self.full_update_next = True
 
         if issubclass(type(scene), Scene):
             self.scene = scene
@@ -167,6 +220,8 @@ class App:
         if cache_old_scene and old_scene.scene_cache_id:
             self.scene_cache[old_scene.scene_cache_id] = old_scene
 
+        self.scene.on_enter()
+
     def change_scene_anim(self, scene: Scene or str or Callable[[None], Scene], cache_old_scene=True, duration=0.2):
         if self.changing_scene:
             return
@@ -205,6 +260,8 @@ class App:
         update_window = (force_update_window or prev_windowed != self.windowed or
                          (prev_resolution != self.window_resolution and self.windowed))
 
+        self.full_update_next = True
+
         if update_window:
             if self.windowed:
                 self.screen = pygame.display.set_mode(self.window_resolution)
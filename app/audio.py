@@ -1,3 +1,7 @@
+import os
+from pathlib import Path
+from typing import Iterable
+
 import pygame
 
 from app import app_settings
@@ -5,25 +9,67 @@ from app import app_settings
 
 IGNORE_MISSING_FILES = True
 
+SFX_FOLDERS = ("assets/audio/game", "assets/audio/widgets")
+PRELOAD_SIZE_LIMIT = 8 * 1024 * 1024
+"""The maximum total file size (in bytes) of the sound effects that are preloaded. Sound effects that don't fit in the
+limit are loaded the first time they are played instead."""
+
 
 """
 Sound Effects
 """
 class SoundGroup:
     sound_cache: dict[str, pygame.mixer.Sound] = {}
+    last_volumes: dict[str, float] = {}  # The volume that was last set for each cached sound.
     volume = 1.0
 
     @staticmethod
     def play_sound(filename, volume_mult=1.0):
         try:
-            sound = SoundGroup.sound_cache.setdefault(filename, pygame.mixer.Sound(filename))
-            sound.set_volume(SoundGroup.volume * volume_mult)
+            sound = SoundGroup.sound_cache.get(filename)
+            if not sound:
+                sound = SoundGroup.sound_cache[filename] = pygame.mixer.Sound(filename)
+
+            volume = SoundGroup.volume * volume_mult
+            if SoundGroup.last_volumes.get(filename) != volume:
+                sound.set_volume(volume)
+                SoundGroup.last_volumes[filename] = volume
+
             sound.play()
 
         except FileNotFoundError as e:
             if not IGNORE_MISSING_FILES:
                 raise e
 
+    @staticmethod
+    def preload(filenames: Iterable[str], size_limit=PRELOAD_SIZE_LIMIT):
+        """
+        Load sound files into the sound cache ahead of time, so that the first time a sound is played doesn't stall
+        the main loop.
+
+        :param filenames: The paths of the sound files, in the same format as the ones passed into `play_sound`.
+        :param size_limit: The maximum total file size in bytes. Once the limit is reached, the rest of the files are
+                           not preloaded.
+        """
+        total_size = 0
+
+        for filename in filenames:
+            if filename in SoundGroup.sound_cache:
+                continue
+
+            total_size += os.path.getsize(filename)
+            if total_size > size_limit:
+                break
+
+            SoundGroup.sound_cache[filename] = pygame.mixer.Sound(filename)
+
+    @staticmethod
+    def get_sfx_filenames() -> list[str]:
+        """
+        Returns the paths of all the sound effect files in the `SFX_FOLDERS`.
+        """
+        return [path.as_posix() for folder in SFX_FOLDERS for path in sorted(Path(folder).rglob("*.mp3"))]
+
     @staticmethod
     def update_volume():
         SoundGroup.volume = app_settings.main.get_value("sfx_volume")
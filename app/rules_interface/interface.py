@@ -27,3 +27,10 @@ class InterfaceGame(PokerGame):
 
     def update(self, dt):
         self.timer_group.update(dt)
+
+    @property
+    def idle(self) -> bool:
+        """
+        True if the game isn't waiting on any scheduled events.
+        """
+        return not self.timer_group.timers
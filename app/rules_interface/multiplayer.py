@@ -9,13 +9,51 @@ functionality of their parent classes disabled, because most of the calculations
 job of these classes is only to interface the server-side game to the player's screen.
 """
 from online.client.client_comms import ClientComms
-from online.data.game_sync import GameSyncEvent, load_attrs, GAME_SYNC
+from online.data.game_sync import GameSyncEvent, load_attrs, GAME_SYNC_CODES
 from online.data.packets import Packet, PacketTypes
 from app.rules_interface.interface import InterfaceGame
 from rules.basic import HandRanking
 from rules.game_flow import GameEvent, Player, Hand, Actions, PlayerHand
 
 
+MAX_EVENTS_PER_FRAME = 64
+"""The maximum number of queued game events that are dispatched in a single update (frame)."""
+
+ACTION_CODES = {name: value for name, value in vars(Actions).items() if not name.startswith("_")}
+ACTION_CODES["ALL IN"] = Actions.RAISE
+"""`ACTION_CODES` maps an uppercased action message of a game event (e.g. "CALL", "ALL IN") to its action code."""
+
+EVENT_POOL_SIZE = 32
+"""The maximum number of dispatched `GameEvent` objects that are kept in the event pool to be reused."""
+
+event_pool: list[GameEvent] = []
+
+
+def acquire_event(code: int, prev_player=-1, next_player=-1, message="", bet_amount=0) -> GameEvent:
+    """
+    Returns a `GameEvent` with the given fields, reusing an object from the event pool if there is one available.
+    """
+    if not event_pool:
+        return GameEvent(code, prev_player, next_player, message, bet_amount)
+
+    game_event = event_pool.pop()
+    game_event.code = code
+    game_event.prev_player = prev_player
+    game_event.next_player = next_player
+    game_event.message = message
+    game_event.bet_amount = bet_amount
+
+    return game_event
+
+
+def release_event(game_event: GameEvent) -> None:
+    """
+    Put a `GameEvent` that has been dispatched back into the event pool. The event must not be used after releasing it.
+    """
+    if len(event_pool) < EVENT_POOL_SIZE:
+        event_pool.append(game_event)
+
+
 class MultiplayerHand(Hand):
     def __init__(self, game: "MultiplayerGame"):
         super().__init__(game)
@@ -23,6 +61,8 @@ class MultiplayerHand(Hand):
         self.deck = []
 
         self.client_player_hand: PlayerHand or None = self.game.client_player.player_hand
+        self.last_ranking_key: tuple or None = None
+        # The community cards and the client's pocket cards that the client's hand ranking was last calculated with.
 
     def deal_cards(self):
         """
@@ -52,7 +92,13 @@ class MultiplayerHand(Hand):
         Reset player hands
         """
         if self.client_player_hand:
-            self.client_player_hand.hand_ranking = HandRanking(self.community_cards + self.client_player_hand.pocket_cards)
+            ranking_key = (tuple(self.community_cards), tuple(self.client_player_hand.pocket_cards))
+
+            # The ranking only needs to be recalculated if the cards have changed since the last round.
+            if ranking_key != self.last_ranking_key:
+                self.client_player_hand.hand_ranking = HandRanking(self.community_cards +
+                                                                   self.client_player_hand.pocket_cards)
+                self.last_ranking_key = ranking_key
 
         for player in self.players:
             player.current_round_spent = 0
@@ -65,41 +111,61 @@ class MultiplayerGame(InterfaceGame):
         super().__init__()
         self.client_player = Player(self, "Placeholder thingy", 1000)
 
+        self.event_handlers = {
+            GameEvent.NEW_HAND: self.on_new_hand,
+            GameEvent.START_HAND: self.on_start_hand,
+            GameEvent.NEW_ROUND: self.on_new_round,
+            GameEvent.SKIP_ROUND: self.on_new_round,
+            GameEvent.JOIN_MID_GAME: self.on_join_mid_game,
+        }
+        """`event_handlers` maps a game event code to the method that handles that specific type of event. Event codes
+        that are not in this dict are handled by `on_other_event`."""
+
     def sync_game(self, game_sync_event: GameSyncEvent):
         """
         this will be our last jujutsu kaisen, sukuna
         """
+        self.sync_players(game_sync_event)
+        self.sync_hand(game_sync_event)
+
+    def sync_players(self, game_sync_event: GameSyncEvent):
+        """
+        Sync the attributes of the game itself and its players, and determine the client player object. This part of the
+        sync must be done before creating a new hand, as the player hands are created based on the players list.
+        """
         # Sync the attributes of `self`
         load_attrs(self, game_sync_event.attr_dict, ["players", "hand"])
 
         # Sync the attributes of `self.players` (list of `Player`)
         if "players" in game_sync_event.attr_dict:
-            old_players_dict = {x.name: x for x in self.players}
-            new_players_list = []
+            players_attr_list = game_sync_event.attr_dict["players"]
 
-            for player_attr_dict in game_sync_event.attr_dict["players"]:
-                if player_attr_dict["name"] in old_players_dict:
-                    # Existing player
-                    player = old_players_dict[player_attr_dict["name"]]
+            if [x["name"] for x in players_attr_list] == [x.name for x in self.players]:
+                # Same players in the same order (the most common case): only update the chips in place.
+                for player, player_attr_dict in zip(self.players, players_attr_list):
                     player.chips = player_attr_dict["chips"]
-                    new_players_list.append(player)
 
-                else:
-                    # New player
-                    player = Player(self, player_attr_dict["name"], player_attr_dict["chips"])
-                    new_players_list.append(player)
+            else:
+                # The players have changed: rebuild the players list.
+                old_players_dict = {x.name: x for x in self.players}
+                new_players_list: list[Player or None] = [None] * len(players_attr_list)
 
-            self.players = new_players_list
+                for i, player_attr_dict in enumerate(players_attr_list):
+                    player = old_players_dict.get(player_attr_dict["name"])
 
-            for i, player in enumerate(self.players):
-                player.player_number = i
+                    if player is not None:
+                        # Existing player
+                        player.chips = player_attr_dict["chips"]
+                    else:
+                        # New player
+                        player = Player(self, player_attr_dict["name"], player_attr_dict["chips"])
 
-        # Sync the attributes of `self.hand` (instance of `Hand`)
-        if "hand" in game_sync_event.attr_dict and self.hand:
-            load_attrs(self.hand, game_sync_event.attr_dict["hand"], ["players"])
+                    new_players_list[i] = player
 
-            for player_hand, player_hand_attr_dict in zip(self.hand.players, game_sync_event.attr_dict["hand"]["players"]):
-                load_attrs(player_hand, player_hand_attr_dict)
+                self.players = new_players_list
+
+                for i, player in enumerate(self.players):
+                    player.player_number = i
 
         # Determine the client player object
         if game_sync_event.client_player_number >= 0:
@@ -107,6 +173,17 @@ class MultiplayerGame(InterfaceGame):
         elif game_sync_event.client_player_number == -2:
             self.client_player.player_number = -2
 
+    def sync_hand(self, game_sync_event: GameSyncEvent):
+        """
+        Sync the attributes of the current hand and its player hands, including the pocket cards of the client player.
+        """
+        # Sync the attributes of `self.hand` (instance of `Hand`)
+        if "hand" in game_sync_event.attr_dict and self.hand:
+            load_attrs(self.hand, game_sync_event.attr_dict["hand"], ["players"])
+
+            for player_hand, player_hand_attr_dict in zip(self.hand.players, game_sync_event.attr_dict["hand"]["players"]):
+                load_attrs(player_hand, player_hand_attr_dict)
+
         # Sync the pocket cards of the client player
         if game_sync_event.client_pocket_cards and self.client_player.player_hand:
             self.client_player.player_hand.pocket_cards = game_sync_event.client_pocket_cards
@@ -120,7 +197,7 @@ class MultiplayerGame(InterfaceGame):
         :param game_event:
         :param game_sync_event:
         """
-        if game_event.code in GAME_SYNC and not game_sync_event:
+        if game_event.code in GAME_SYNC_CODES and not game_sync_event:
             raise ValueError(f"game event of type {game_event.code} must be provided with a game sync event")
 
         """
@@ -128,12 +205,9 @@ class MultiplayerGame(InterfaceGame):
         """
         if game_event.prev_player != -1 and game_event.message:
             action_message = game_event.message.upper()
+            action_code = ACTION_CODES.get(action_message)
 
-            if action_message in Actions.__dict__:
-                action_code = Actions.__dict__[action_message]
-            elif action_message == "ALL IN":
-                action_code = Actions.RAISE
-            else:
+            if action_code is None:
                 raise ValueError(f"invalid action message: {action_message}")
 
             self.players[game_event.prev_player].action(action_code, game_event.bet_amount)
@@ -144,51 +218,55 @@ class MultiplayerGame(InterfaceGame):
         """
         Handle type-specific events.
         """
-        match game_event.code:
-            case GameEvent.NEW_HAND:
-                self.sync_game(game_sync_event)
-                self.new_hand()
-                if game_sync_event.client_pocket_cards:
-                    self.client_player.player_hand.pocket_cards = game_sync_event.client_pocket_cards
-                else:
-                    raise AttributeError("the game data should've came with client pocket cards on a new hand, but the "
-                                         "server didn't provide it for some reason")
-
-            case GameEvent.START_HAND:
-                self.hand.start_hand()
-
-            case GameEvent.NEW_ROUND | GameEvent.SKIP_ROUND:
-                self.sync_game(game_sync_event)
-                self.hand.next_round()
-
-            case GameEvent.JOIN_MID_GAME:
-                self.sync_game(game_sync_event)
-                self.new_hand()
-                self.sync_game(game_sync_event)
-
-                # Convert the last action and bet amount of all the player hands into a series of game events to update
-                # the sub-texts of the player displays in the game scene.
-                for player_number, player_hand in enumerate(self.hand.players):
-                    if player_hand.last_action and player_hand.last_action != "folded":
-                        ClientComms.game_event_queue.append(GameEvent(
-                            code=GameEvent.DEFAULT_ACTION,
-                            prev_player=player_number,
-                            next_player=-1,
-                            message=player_hand.last_action,
-                            bet_amount=player_hand.current_round_spent)
-                        )
-
-            case _:
-                if game_sync_event:
-                    self.sync_game(game_sync_event)
+        self.event_handlers.get(game_event.code, self.on_other_event)(game_event, game_sync_event)
 
         """
         Forward the event to the game scene's event receiver
         """
         self.event_receiver(game_event)
 
+    """
+    Type-specific event handlers
+    """
+    def on_new_hand(self, game_event: GameEvent, game_sync_event: GameSyncEvent):
+        self.sync_game(game_sync_event)
+        self.new_hand()
+        if game_sync_event.client_pocket_cards:
+            self.client_player.player_hand.pocket_cards = game_sync_event.client_pocket_cards
+        else:
+            raise AttributeError("the game data should've came with client pocket cards on a new hand, but the "
+                                 "server didn't provide it for some reason")
+
+    def on_start_hand(self, game_event: GameEvent, game_sync_event: GameSyncEvent or None):
+        self.hand.start_hand()
+
+    def on_new_round(self, game_event: GameEvent, game_sync_event: GameSyncEvent):
+        self.sync_game(game_sync_event)
+        self.hand.next_round()
+
+    def on_join_mid_game(self, game_event: GameEvent, game_sync_event: GameSyncEvent):
+        self.sync_players(game_sync_event)
+        self.new_hand()
+        self.sync_hand(game_sync_event)
+
+        # Convert the last action and bet amount of all the player hands into a series of game events to update
+        # the sub-texts of the player displays in the game scene.
+        for player_number, player_hand in enumerate(self.hand.players):
+            if player_hand.last_action and player_hand.last_action != "folded":
+                ClientComms.game_event_queue.append(acquire_event(
+                    code=GameEvent.DEFAULT_ACTION,
+                    prev_player=player_number,
+                    next_player=-1,
+                    message=player_hand.last_action,
+                    bet_amount=player_hand.current_round_spent)
+                )
+
+    def on_other_event(self, game_event: GameEvent, game_sync_event: GameSyncEvent or None):
+        if game_sync_event:
+            self.sync_game(game_sync_event)
+
     def action(self, action_type, new_amount=0):
-        ClientComms.send_packet(Packet(PacketTypes.GAME_ACTION, content=(action_type, new_amount)))
+        ClientComms.queue_packet(Packet(PacketTypes.GAME_ACTION, content=(action_type, new_amount)))
 
     def broadcast(self, broadcast: GameEvent) -> None:
         """
@@ -206,12 +284,24 @@ class MultiplayerGame(InterfaceGame):
     def update(self, dt):
         super().update(dt)
 
-        if ClientComms.game_event_queue:
-            event: GameEvent or GameSyncEvent = ClientComms.game_event_queue.pop(0)
+        if not ClientComms.game_event_queue:
+            return
+
+        # Drain the queued events in one go, so that a burst of events from the server is applied in a single frame.
+        # Events appended while dispatching (e.g. on a JOIN_MID_GAME event) are left for the next frame.
+        for _ in range(min(len(ClientComms.game_event_queue), MAX_EVENTS_PER_FRAME)):
+            event: GameEvent or GameSyncEvent = ClientComms.game_event_queue.popleft()
 
-            if type(event) is GameEvent:
+            kind = getattr(event, "KIND", None)
+
+            if kind == GameEvent.KIND:
                 self.on_event(event)
-            elif type(event) is GameSyncEvent:
+                release_event(event)
+            elif kind == GameSyncEvent.KIND:
                 self.on_event(GameEvent(event.code), event)
             else:
                 raise TypeError(f"invalid object type in the game event queue: {type(event)}")
+
+    @property
+    def idle(self) -> bool:
+        return super().idle and not ClientComms.game_event_queue
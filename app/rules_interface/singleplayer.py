@@ -12,7 +12,7 @@ from app.rules_interface.interface import *
 class Bot(Player):
     def receive_event(self, event: GameEvent):
         # Run self.action after 0.5 seconds
-        if event.next_player == self.game.players.index(self):
+        if event.next_player == self.player_number:
             self.game: SingleplayerGame
             timer_group = self.game.timer_group if type(self.game) is SingleplayerGame else None
 
@@ -64,6 +64,9 @@ class SingleplayerGame(InterfaceGame):
         self.bots = [Bot(self, f"Bot {i + 1}", starting_chips) for i in range(n_bots)]
         self.players: list[Player] = [self.client_player] + self.bots
 
+        for i, player in enumerate(self.players):
+            player.player_number = i
+
         self.sb_amount = sb_amount
 
     def on_event(self, event):
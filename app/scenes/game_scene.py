@@ -1,4 +1,5 @@
 import random
+from itertools import chain
 
 from app.animations.interpolations import ease_out, ease_in, linear
 from app.audio import play_sound
@@ -6,16 +7,16 @@ from app.widgets.game.side_pot_panel import SidePotPanel
 from app.widgets.menu.side_menu import SideMenu, SideMenuButton
 
 from rules.basic import HandRanking
-from rules.game_flow import GameEvent
+from rules.game_flow import GameEvent, Player
 from app.rules_interface.singleplayer import InterfaceGame, SingleplayerGame
 
 from app.scenes.scene import Scene
 from app.shared import *
-from app.tools import app_timer, app_async
+from app.tools import app_timer
 
 from app import widgets, app_settings
 from app.widgets.game.card import Card
-from app.widgets.game.action_buttons import FoldButton, RaiseButton, CallButton
+from app.widgets.game.action_buttons import ActionButton, FoldButton, RaiseButton, CallButton
 from app.widgets.game.dealer_button import DealerButton
 from app.widgets.game.winner_crown import WinnerCrown
 from app.widgets.game.player_display import PlayerDisplay
@@ -27,6 +28,43 @@ from app.animations.var_slider import VarSlider
 COMM_CARD_ROTATIONS = (198, 126, 270, 54, -18)
 """`COMM_CARD_ROTATIONS` defines the rotation for the animation's starting position of the n-th community card."""
 
+RANKING_STR_CAP = tuple(x.capitalize() for x in HandRanking.TYPE_STR)
+"""`RANKING_STR_CAP` is `HandRanking.TYPE_STR` with each string capitalized, for displaying hand rankings."""
+
+ROUND_NAMES = ("", "", "", "flop", "turn", "river")
+"""`ROUND_NAMES[n]` is the name of the betting round where there are n community cards on the table."""
+
+SFX_PATHS = {
+    "chips": "assets/audio/game/actions/chips.mp3",
+    "all in": "assets/audio/game/actions/all in.mp3",
+    "blinds": "assets/audio/game/rounds/blinds.mp3",
+    "player slide": "assets/audio/game/player/slide.mp3",
+    "deal cards": "assets/audio/game/card/deal cards.mp3",
+    "reveal cards": "assets/audio/game/card/reveal cards.mp3",
+    "win": "assets/audio/game/showdown/win.mp3",
+}
+"""`SFX_PATHS` maps the name of a sound effect used in the game scene to its file path. See `play_sfx`."""
+
+ACTION_SFX = {action: f"assets/audio/game/actions/{action}.mp3"
+              for action in ("fold", "check", "call", "bet", "raise", "all in")}
+"""`ACTION_SFX` maps the message of a player action game event to the path of its sound effect."""
+
+CARD_SLIDE_SFX = tuple(f"assets/audio/game/card/slide/{x}.mp3" if x else "" for x in ROUND_NAMES)
+ROUND_SFX = tuple(f"assets/audio/game/rounds/{x}.mp3" if x else "" for x in ROUND_NAMES)
+"""`CARD_SLIDE_SFX[n]` and `ROUND_SFX[n]` are the paths of the sound effects played on the betting round where there are
+n community cards on the table, indexed the same way as `ROUND_NAMES`."""
+
+REVEAL_SFX = tuple(f"assets/audio/game/showdown/reveal {i}.mp3" for i in range(1, 11))
+"""`REVEAL_SFX[n - 1]` is the path of the sound effect played when revealing the hand ranking of the n-th place player."""
+
+
+def play_sfx(name: str, volume_mult=1.0):
+    """
+    Play a sound effect of the game scene by its name in `SFX_PATHS`. The sounds themselves are preloaded and cached by
+    `SoundGroup` in the audio module.
+    """
+    play_sound(SFX_PATHS[name], volume_mult)
+
 
 ## noinspection PyUnresolvedReferences,PyTypeChecker
 class GameScene(Scene):
@@ -36,6 +74,11 @@ class GameScene(Scene):
         self.game: InterfaceGame = game
         self.game.event_receiver = self.receive_event
 
+        self.client_player: Player = self.game.client_player
+        self.client_player_number: int = self.client_player.player_number
+        """The client player data and its player number are cached from the game, and refreshed on every game event that
+        isn't a player action (see `receive_event`), as those are the only events where they can change."""
+
         """
         Miscellaneous GUI
         """
@@ -46,6 +89,9 @@ class GameScene(Scene):
         self.side_menu.set_shown(False, 0)
 
         self.flash_fac = 0
+        self.flash_color = (0, 0, 0)  # The color added to the screen for the flash. Updated by `set_flash_fac`.
+        self.flash_shown = False  # True if the showdown flash was drawn on the previous update.
+        self.pot_sum_cache: Optional[int] = None  # See `get_pot_sum`.
         self.joining_mid_game = False
 
         """
@@ -53,8 +99,8 @@ class GameScene(Scene):
         """
         self.table = widgets.game.table.Table(self, 0, 0, 55, 55, "%", "ctr", "ctr")
 
-        self.players = pygame.sprite.Group()
-        self.winner_crowns = pygame.sprite.Group()
+        self.players = FastGroup()
+        self.winner_crowns = FastGroup()
 
         """
         Table texts
@@ -71,7 +117,7 @@ class GameScene(Scene):
         """
         Action buttons and bet prompt
         """
-        self.action_buttons = pygame.sprite.Group()
+        self.action_buttons: tuple[ActionButton, ...] = ()
 
         self.fold_button = None
         self.call_button = None
@@ -92,7 +138,13 @@ class GameScene(Scene):
         Cards and game initialization
         """
         Card.set_size(height=h_percent_to_px(12.5))  # Initialize card size
-        self.community_cards = pygame.sprite.Group()
+        self.community_cards = FastGroup()
+
+        self.all_cards: list[Card] = []
+        """A list of all the card displays on the table in the current hand: the community cards and the pocket cards of
+        every player. Used for highlighting cards."""
+
+        self.any_card_highlighted = False  # False if none of the cards in `all_cards` are currently highlighted.
 
         if type(game) is SingleplayerGame:
             self.game.start_game()
@@ -103,6 +155,12 @@ class GameScene(Scene):
         """
         # print(event)
 
+        if event.code not in (GameEvent.DEFAULT_ACTION, GameEvent.START_HAND):
+            # The pots and the client player may have changed on any event other than a player action.
+            self.pot_sum_cache = None
+            self.client_player = self.game.client_player
+            self.client_player_number = self.client_player.player_number
+
         """
         Handle non-player-action events
         """
@@ -160,7 +218,7 @@ class GameScene(Scene):
                 Update the pot text
                 """
                 if not is_sb:
-                    total_pot = sum(self.game.hand.pots) + self.game.hand.current_round_bets
+                    total_pot = self.get_pot_sum() + self.game.hand.current_round_bets
                     self.pot_text.set_text_anim(total_pot)
                     self.side_pot_panel.update_current_bets()
 
@@ -168,10 +226,11 @@ class GameScene(Scene):
                 Chips sound effect
                 """
                 if not self.joining_mid_game:
-                    play_sound("assets/audio/game/actions/chips.mp3", 0.5)
+                    play_sfx("chips", 0.5)
 
-            self.players.sprites()[event.prev_player].set_sub_text_anim(action_str)
-            self.players.sprites()[event.prev_player].update_chips()
+            player_display: PlayerDisplay = self.players.sprites()[event.prev_player]
+            player_display.set_sub_text_anim(action_str)
+            player_display.update_chips()
 
         """
         Action sound effect
@@ -181,22 +240,22 @@ class GameScene(Scene):
 
         elif event.code == GameEvent.START_HAND:
             if is_sb:
-                play_sound("assets/audio/game/rounds/blinds.mp3")
+                play_sfx("blinds")
             if event.message == "all in":
-                play_sound("assets/audio/game/actions/all in.mp3")
+                play_sfx("all in")
 
-        elif event.message:
-            play_sound(f"assets/audio/game/actions/{event.message}.mp3")
+        elif event.message in ACTION_SFX:
+            play_sound(ACTION_SFX[event.message])
 
         """
         Show/hide action buttons
         """
-        if event.next_player == self.game.client_player.player_number and not is_sb:
+        if event.next_player == self.client_player_number and not is_sb:
             for x in self.action_buttons:
                 x.update_bet_amount(self.game.hand.amount_to_call)
             self.show_action_buttons(True)
 
-        elif event.prev_player == self.game.client_player.player_number:
+        elif event.prev_player == self.client_player_number:
             self.show_action_buttons(False)
             self.bet_prompt.set_shown(False)
 
@@ -217,25 +276,25 @@ class GameScene(Scene):
         """
 
         self.dealer_button.set_shown(False)
-        play_sound("assets/audio/game/player/slide.mp3")
+        play_sfx("player slide")
 
-        old_group = self.players.copy()
-        self.players.empty()
+        old_by_data: dict[Player, PlayerDisplay] = {x.player_data: x for x in self.players}
+        """A dict that maps the player data of each player display that exists before rearranging the players to the
+        player display itself. Player displays that are reused are popped from the dict, so the ones left over are the
+        player displays to be removed."""
 
-        player_display_datas = [x.player_data for x in old_group.sprites()]
-        """A list of the player data of each player display that exists before rearranging the players."""
+        self.players.empty()
 
         for i, player_data in enumerate(self.game.players):
             pos = self.table.get_player_pos(i, (1.25, 1.2))
 
             player_display: PlayerDisplay
 
-            if player_data in player_display_datas:
+            if player_data in old_by_data:
                 """
                 1. Move player display
                 """
-                old_i = player_display_datas.index(player_data)
-                player_display = old_group.sprites()[old_i]
+                player_display = old_by_data.pop(player_data)
 
             else:
                 """
@@ -252,16 +311,15 @@ class GameScene(Scene):
 
         screen_center = self.rect.center
 
-        for i, old_player_display in enumerate(old_group.sprites()):
-            if old_player_display not in self.players:
-                """
-                3. Remove player display
-                """
-                start_pos = old_player_display.rect.center
-                end_pos = screen_center + 3 * (Vector2(start_pos) - screen_center)  # Offscreen
+        for i, old_player_display in enumerate(old_by_data.values()):
+            """
+            3. Remove player display
+            """
+            start_pos = old_player_display.rect.center
+            end_pos = screen_center + 3 * (Vector2(start_pos) - screen_center)  # Offscreen
 
-                old_player_display.move_anim(1.5 + i * time_interval, end_pos,
-                                             call_on_finish=lambda x=old_player_display: self.all_sprites.remove(x))
+            old_player_display.move_anim(1.5 + i * time_interval, end_pos,
+                                         call_on_finish=lambda x=old_player_display: self.all_sprites.remove(x))
 
     def init_action_buttons(self):
         """
@@ -280,8 +338,9 @@ class GameScene(Scene):
         self.call_button = CallButton(self, *rects[1])
         self.raise_button = RaiseButton(self, *rects[2])
 
-        for x in (self.fold_button, self.call_button, self.raise_button):
-            self.action_buttons.add(x)
+        self.action_buttons = (self.fold_button, self.call_button, self.raise_button)
+
+        for x in self.action_buttons:
             x.set_shown(False, 0.0)
 
         """
@@ -297,7 +356,7 @@ class GameScene(Scene):
             x.set_shown(shown, duration=0.4 + 0.05 * i)
 
     def show_bet_prompt(self, shown: bool):
-        if self.game.hand.current_turn != self.game.client_player.player_number:
+        if self.game.hand.current_turn != self.client_player_number:
             self.bet_prompt.set_shown(False)
             return
 
@@ -315,16 +374,22 @@ class GameScene(Scene):
         Create card displays that represent the pocket cards of each player, and move them to the position of their
         respective players.
         """
-        play_sound("assets/audio/game/card/deal cards.mp3")
+        play_sfx("deal cards")
+
+        card_offset = w_percent_to_px(1)  # Horizontal offset of each pocket card from the middle of the player
 
         for i, player_display in enumerate(self.players.sprites()):
-            if player_display.player_data.player_hand.folded:
+            player_display: PlayerDisplay
+            player_hand = player_display.player_data.player_hand
+
+            if player_hand.folded:
                 continue
 
+            is_client = player_display.player_data is self.client_player
+            mid_x, y = player_display.rect_after_move.midtop
+
             for j in range(2):  # Every player has 2 pocket cards
-                player_display: PlayerDisplay
-                x, y = player_display.rect_after_move.midtop
-                x += w_percent_to_px(1) * (1 if j else -1)
+                x = mid_x + (card_offset if j else -card_offset)
 
                 start_pos = self.table.get_player_pos(i, (2.75, 2.75), 2)
 
@@ -334,9 +399,10 @@ class GameScene(Scene):
                 # Pocket cards are added to 2 different sprite groups.
                 self.all_sprites.add(card)
                 player_display.pocket_cards.add(card)
+                self.all_cards.append(card)
 
-                if player_display.player_data is self.game.client_player:
-                    card.card_data = player_display.player_data.player_hand.pocket_cards[j]
+                if is_client:
+                    card.card_data = player_hand.pocket_cards[j]
                     animation.call_on_finish = card.reveal
 
         app_timer.Timer(1, self.pot_text.set_shown, (True,))
@@ -351,39 +417,42 @@ class GameScene(Scene):
 
         :param unhighlight: If set to True then clear all the highlights.
         """
-        if app_settings.main.get_value("card_highlights") == "off":
+        highlight_mode = app_settings.main.get_value("card_highlights")
+
+        if highlight_mode == "off" or not self.all_cards or (unhighlight and not self.any_card_highlighted):
             return
 
-        ranked_cards: set = set()
-        kickers: set = set()
+        include_kickers = highlight_mode == "all_always" or (showdown and highlight_mode == "all")
+        # Kickers are highlighted on showdowns if the setting is "all", and all the time if it's "all_always".
 
-        if unhighlight:
-            pass
+        card_status: dict[tuple, bool] = {}
+        """Maps each card (card data) to be highlighted to True if it's a ranked card, or False if it's a kicker."""
 
+        if unhighlight:
+            hand_rankings = []
         elif showdown:
             # Showdown: Highlight the winning hand(s)
-            ranked_cards = set(card for winner_index in self.game.hand.winners[0]
-                                    for card in self.game.hand.players[winner_index].hand_ranking.ranked_cards)
-
-            if app_settings.main.get_value("card_highlights") in ("all", "all_always"):
-                kickers = set(card for winner_index in self.game.hand.winners[0]
-                                    for card in self.game.hand.players[winner_index].hand_ranking.kickers)
-
+            hand_rankings = [self.game.hand.players[winner_index].hand_ranking
+                             for winner_index in self.game.hand.winners[0]]
         else:
             # Highlight the ranked cards of the client user
-            ranked_cards = set(self.game.client_player.player_hand.hand_ranking.ranked_cards)
+            hand_rankings = [self.client_player.player_hand.hand_ranking]
 
-            if app_settings.main.get_value("card_highlights") == "all_always":
-                kickers = set(self.game.client_player.player_hand.hand_ranking.kickers)
+        for hand_ranking in hand_rankings:
+            for card in hand_ranking.ranked_cards:
+                card_status[card] = True
 
-        highlighted_cards = set.union(ranked_cards, kickers)
-        card_displays = self.community_cards.sprites() + [card for player_display in self.players
-                                                          for card in player_display.pocket_cards]
+        if include_kickers:
+            for hand_ranking in hand_rankings:
+                for card in hand_ranking.kickers:
+                    card_status.setdefault(card, False)
 
-        for card_display in card_displays:
+        for card_display in self.all_cards:
             if card_display.is_revealed:
-                card_display.show_highlight(card_display.card_data in highlighted_cards,
-                                            ranked=card_display.card_data not in kickers)
+                status = card_status.get(card_display.card_data)
+                card_display.show_highlight(status is not None, ranked=status is not False)
+
+        self.any_card_highlighted = bool(card_status)
 
     def fold_cards(self, i: int):
         """
@@ -393,14 +462,15 @@ class GameScene(Scene):
         """
         player = self.players.sprites()[i]
 
-        for card in player.pocket_cards:
-            if player.player_data is self.game.client_player:
+        if player.player_data is self.client_player:
+            for card in player.pocket_cards:
                 card.fade_anim(0.25, 128)
 
-                if self.ranking_text.shown:
-                    self.ranking_text.set_text_anim("Folded:  " + self.ranking_text.text_str)
+            if self.ranking_text.shown:
+                self.ranking_text.set_text_anim("Folded:  " + self.ranking_text.text_str)
 
-            else:
+        else:
+            for card in player.pocket_cards:
                 pos = self.table.get_player_pos(i, (2.75, 2.75), 2)
 
                 card.move_anim(random.uniform(1, 1.5), pos)
@@ -417,10 +487,13 @@ class GameScene(Scene):
 
         self.update_chips_texts()
 
+        old_n_cards = len(self.community_cards)  # Number of community cards already shown
+        new_n_cards = len(self.game.hand.community_cards)  # Number of community cards after this round
+
         """
         Show next community cards
         """
-        for i in range(len(self.community_cards), len(self.game.hand.community_cards)):
+        for i in range(old_n_cards, new_n_cards):
             card_data = self.game.hand.community_cards[i]
 
             start_pos = self.table.get_edge_pos(COMM_CARD_ROTATIONS[i], (3, 3), 5)
@@ -430,29 +503,25 @@ class GameScene(Scene):
                            call_on_finish=card.reveal)
 
             self.community_cards.add(card)
+            self.all_cards.append(card)
 
-        anim_delay = 2 + len(self.community_cards) / 8
+        anim_delay = 2 + new_n_cards / 8
 
         """
         Card sliding sound effect
         """
-        round_names = {3: "flop", 4: "turn", 5: "river"}
-
-        play_sound(f"assets/audio/game/card/slide/{round_names[len(self.community_cards)]}.mp3")
+        play_sound(CARD_SLIDE_SFX[new_n_cards])
 
         if not self.joining_mid_game:
-            app_timer.Timer(
-                anim_delay,
-                lambda: play_sound(f"assets/audio/game/rounds/{round_names[len(self.community_cards)]}.mp3")
-            )
+            app_timer.Timer(anim_delay, play_sound, (ROUND_SFX[new_n_cards],))
 
         """
         Update hand ranking
         """
-        if self.game.client_player.player_hand:
-            ranking_int = self.game.client_player.player_hand.hand_ranking.ranking_type
-            ranking_str = HandRanking.TYPE_STR[ranking_int].capitalize()
-            if self.game.client_player.player_hand.folded:
+        if self.client_player.player_hand:
+            ranking_int = self.client_player.player_hand.hand_ranking.ranking_type
+            ranking_str = RANKING_STR_CAP[ranking_int]
+            if self.client_player.player_hand.folded:
                 ranking_str = "Folded:  " + ranking_str
 
             app_timer.Timer(anim_delay, self.ranking_text.set_text_anim, (ranking_str,))
@@ -461,8 +530,8 @@ class GameScene(Scene):
         """
         Hide blinds button and show ranking text on the flop round
         """
-        if len(self.game.hand.community_cards) == 3:
-            if self.game.client_player.player_number >= 0:
+        if new_n_cards == 3:
+            if self.client_player_number >= 0:
                 app_timer.Timer(2, self.ranking_text.set_shown, (True,))
 
             self.sb_button.set_shown(False)
@@ -477,73 +546,106 @@ class GameScene(Scene):
         self.highlight_cards(unhighlight=True)
         self.update_chips_texts(update_players=False)
 
-        for player in self.players.sprites():
+        players = self.players.sprites()
+
+        for player in players:
             player.set_sub_text_anim("")
 
         """
         Show all pocket cards
         """
-        play_sound("assets/audio/game/card/reveal cards.mp3")
+        play_sfx("reveal cards")
 
-        for player_display in self.players.sprites():
-            if player_display.player_data is not self.game.client_player:
-                for i, card in enumerate(player_display.pocket_cards.sprites()):
-                    card.card_data = player_display.player_data.player_hand.pocket_cards[i]
+        for player_display in players:
+            if player_display.player_data is not self.client_player:
+                for card, card_data in zip(player_display.pocket_cards.sprites(),
+                                           player_display.player_data.player_hand.pocket_cards):
+                    card.card_data = card_data
                     card.reveal(random.uniform(1, 1.5), sfx=False)
 
         """
         Start revealing the hand rankings
         """
-        app_async.Coroutine(self.reveal_rankings())
+        app_timer.Timer(2, self.reveal_rankings)
 
-    def reveal_rankings(self) -> Generator[float, None, None]:
-        """
-        Reveal the hand rankings of each player one by one in order from the lowest ranking.
+    def reveal_rankings(self):
         """
+        Reveal the hand rankings of each player one by one in order from the lowest ranking, and then show the winners.
 
-        yield 2  # Delay after the `showdown` method call.
+        All the reveals are scheduled at once as a `Sequence`, with the delays between them computed beforehand.
+        """
 
         """
         Create various lists of player displays.
         """
-        sorted_players: list[PlayerDisplay]
-        sorted_players = [player for player in
-                          sorted(self.players, key=lambda x: x.player_data.player_hand.hand_ranking.overall_score)
-                          if not player.player_data.player_hand.folded]
+        entries: list[tuple[int, int, PlayerDisplay]] = []
+        """A list of (overall score, ranking type, player display) tuples of the players who haven't folded, sorted from
+        the lowest overall score."""
+
+        for player in self.players:
+            player_hand = player.player_data.player_hand
+            if not player_hand.folded:
+                entries.append((player_hand.hand_ranking.overall_score, player_hand.hand_ranking.ranking_type, player))
+
+        entries.sort(key=lambda x: x[0])
 
         n_winners = len(self.game.hand.winners[0])  # Number of main pot winners
 
-        main_winners = sorted_players[-n_winners:]  # List of player displays who won the main pot.
-        all_winners = [player for player in sorted_players
+        main_winners = {player for _, _, player in entries[-n_winners:]}  # Set of player displays who won the main pot.
+        all_winners = [player for _, _, player in entries
                        if player.player_data.player_hand.pots_won]  # List of player displays who won at least one of
                                                                     # the main or side pot(s)
         """
-        Reveal the players' hand rankings.
+        Schedule the reveals of the players' hand rankings, followed by showing the winners.
         """
-        for i, player_display in enumerate(sorted_players):
-            # Update sub text to hand ranking
-            ranking_int = player_display.player_data.player_hand.hand_ranking.ranking_type
+        sequence_list: list[Callable or float] = []
+
+        for i, (_, ranking_int, player_display) in enumerate(entries):
             if ranking_int == 0:
                 continue  # Don't reveal the ranking if the ranking is "n/a"
 
-            ranking_text = HandRanking.TYPE_STR[ranking_int].capitalize()
-            player_display.set_sub_text_anim(ranking_text)
+            rank_number = len(entries) - n_winners - i + 1  # "The current player is ranked in n-th place."
 
-            rank_number = len(sorted_players) - n_winners - i + 1  # "The current player is ranked in n-th place."
-
-            # Play the reveal sound
-            play_sound(f"assets/audio/game/showdown/reveal {rank_number}.mp3",
-                       volume_mult=0.5 + 0.5 / max(1, rank_number))
+            sequence_list.append(lambda x=player_display, y=ranking_int, z=rank_number:
+                                 self.reveal_player_ranking(x, y, z))
 
             # Delay
             if player_display not in main_winners:
-                yield 1 / rank_number
+                sequence_list.append(1 / rank_number)
+
+        sequence_list.append(lambda: self.show_winners(all_winners))
+
+        app_timer.Sequence(sequence_list)
+
+    def reveal_player_ranking(self, player_display: PlayerDisplay, ranking_int: int, rank_number: int):
+        """
+        Reveal the hand ranking of a single player by updating the sub text of its player display.
+
+        :param player_display: The player display of the player.
+        :param ranking_int: The ranking type of the player's hand ranking.
+        :param rank_number: The place of the player in the showdown, used to pick the reveal sound.
+        """
+        player_display.set_sub_text_anim(RANKING_STR_CAP[ranking_int])
+
+        # Play the reveal sound (there are only sounds for the 1st until the 10th place)
+        if 1 <= rank_number <= len(REVEAL_SFX):
+            play_sound(REVEAL_SFX[rank_number - 1], volume_mult=0.5 + 0.5 / rank_number)
+
+    def show_winners(self, all_winners: list[PlayerDisplay]):
+        """
+        Create winner crowns for the winners, update the chips texts, and play the winning effects. Run at the end of
+        revealing the hand rankings.
+
+        :param all_winners: The player displays of the players who have won at least one of the pots.
+        """
 
         """
         Create a winner crown for each winner.
         """
-        show_pots = any(max(self.game.hand.players[winner_number].pots_won) != len(self.game.hand.pots) - 1
-                        for winner_number in self.game.hand.winners[0])
+        hand = self.game.hand
+        last_pot = len(hand.pots) - 1
+
+        show_pots = any(max(hand.players[winner_number].pots_won) != last_pot for winner_number in hand.winners[0])
         # If true then the player crowns show which pots have been won by its represented player.
 
         for player_display in all_winners:
@@ -559,15 +661,12 @@ class GameScene(Scene):
         """
         Extra effects
         """
-        def set_flash_fac(flash_fac):
-            self.flash_fac = int(flash_fac)
-
-        animation = VarSlider(1.5, 50, 0, setter_func=set_flash_fac)
+        animation = VarSlider(1.5, 50, 0, setter_func=self.set_flash_fac)
         self.anim_group.add(animation)
 
         app_timer.Timer(0.25, self.highlight_cards, (True,))
 
-        play_sound("assets/audio/game/showdown/win.mp3", volume_mult=0.7)
+        play_sfx("win", volume_mult=0.7)
 
     def reset_hand(self):
         """
@@ -601,7 +700,7 @@ class GameScene(Scene):
 
             player.set_sub_text_anim("")  # Reset sub text
 
-        play_sound("assets/audio/game/card/deal cards.mp3")
+        play_sfx("deal cards")
 
         # Community cards
         for card, rot in zip(self.community_cards.sprites(), COMM_CARD_ROTATIONS):
@@ -613,7 +712,7 @@ class GameScene(Scene):
         """
         Reset action buttons
         """
-        for x in (self.fold_button, self.call_button, self.raise_button):
+        for x in self.action_buttons:
             x.set_shown(False, 0.0)
 
         self.call_button.all_in = False
@@ -624,17 +723,16 @@ class GameScene(Scene):
         sprite group and other sprite groups.
         """
 
-        for player in self.players.sprites():
-            for card in player.pocket_cards.sprites():
-                self.all_sprites.remove(card)
+        self.all_sprites.remove(*chain(self.community_cards, self.winner_crowns,
+                                       *(player.pocket_cards for player in self.players)))
 
+        for player in self.players:
             player.pocket_cards.empty()
 
-        for sprite in self.community_cards.sprites() + self.winner_crowns.sprites():
-            self.all_sprites.remove(sprite)
-
         self.community_cards.empty()
         self.winner_crowns.empty()
+        self.all_cards.clear()
+        self.any_card_highlighted = False
 
     def move_dealer_button(self, blinds_button=True):
         """
@@ -642,11 +740,12 @@ class GameScene(Scene):
         to their respective player displays.
         """
 
-        dealer: PlayerDisplay = self.players.sprites()[self.game.dealer]
+        players = self.players.sprites()
+        dealer: PlayerDisplay = players[self.game.dealer]
 
         if blinds_button:
-            sb: PlayerDisplay = self.players.sprites()[self.game.hand.blinds[0]]
-            bb: PlayerDisplay = self.players.sprites()[self.game.hand.blinds[1]]
+            sb: PlayerDisplay = players[self.game.hand.blinds[0]]
+            bb: PlayerDisplay = players[self.game.hand.blinds[1]]
 
             app_timer.Sequence([
                 lambda: self.dealer_button.move_to_player(0.75, dealer, interpolation=ease_in),
@@ -660,11 +759,35 @@ class GameScene(Scene):
             self.dealer_button.move_to_player(1, dealer, interpolation=ease_out)
 
 
+    def set_flash_fac(self, flash_fac: float):
+        """
+        Set the brightness of the showdown flash, along with the color that is added to the screen on every update.
+        """
+        flash_fac = int(flash_fac)
+
+        if flash_fac != self.flash_fac:
+            self.flash_fac = flash_fac
+            self.flash_color = (flash_fac, flash_fac, flash_fac)
+
+    def get_pot_sum(self) -> int:
+        """
+        Returns the total amount of chips in the pot(s) of the current hand, excluding the current round bets.
+
+        The pots only change between betting rounds, so the sum is cached and only recalculated after a game event that
+        isn't a player action.
+        """
+        if self.pot_sum_cache is None:
+            self.pot_sum_cache = sum(self.game.hand.pots)
+
+        return self.pot_sum_cache
+
     def update_chips_texts(self, update_players=True):
         self.side_pot_panel.update_all_pots()
 
-        if self.pot_text.pot != sum(self.game.hand.pots):
-            self.pot_text.set_text_anim(sum(self.game.hand.pots))
+        pot_sum = self.get_pot_sum()
+
+        if self.pot_text.pot != pot_sum:
+            self.pot_text.set_text_anim(pot_sum)
 
         if update_players:
             for player in self.players:
@@ -672,9 +795,22 @@ class GameScene(Scene):
                 player.update_chips()
 
     def update(self, dt):
-        super().update(dt)
+        dirty_rects = super().update(dt)
 
         self.game.update(dt)
 
         if self.flash_fac > 0:
-            self.app.display_surface.fill(3 * (self.flash_fac,), special_flags=pygame.BLEND_RGB_ADD)
+            self.app.display_surface.fill(self.flash_color, special_flags=pygame.BLEND_RGB_ADD)
+
+        if self.flash_fac > 0 or self.flash_shown:
+            # The flash covers the whole screen, and so does clearing it on the update after the flash ends.
+            dirty_rects.append(self.rect)
+
+        self.flash_shown = self.flash_fac > 0
+
+        return dirty_rects
+
+    @property
+    def idle(self) -> bool:
+        return (super().idle and self.game.idle and not self.flash_shown and not self.call_button.all_in and
+                not any(player.anim_group.animations for player in self.players))
@@ -31,13 +31,10 @@ class MainMenuScene(Scene):
         self.logo.image = load_image("assets/sprites/misc/logo.png", (0, self.logo.rect.h))
 
         self.version_text = Widget(self, 1, -0.5, 3, 3, "%h", "bl", "bl")
-        self.version_text.image = FontSave.get_font(3).render(VERSION_TEXT, True, "white")
+        self.version_text.image = FontSave.render(3, VERSION_TEXT, "white")
 
-        self.copyright_text = Widget(self, -1, -4, 3, 3, "%h", "br", "br")
-        self.copyright_text.image = FontSave.get_font(3).render(COPYRIGHT_TEXT, True, "white")
-
-        self.copyright_text_sub = Widget(self, -1, -0.5, 3, 3, "%h", "br", "br")
-        self.copyright_text_sub.image = FontSave.get_font(3).render(COPYRIGHT_TEXT_SUB, True, "white")
+        self.copyright_text = Widget(self, -1, -0.5, 3, 3, "%h", "br", "br")
+        self.copyright_text.image = self.render_copyright_text()
 
         """
         Profile customization
@@ -58,38 +55,61 @@ class MainMenuScene(Scene):
         self.singleplayer_button = Button(self, -11, -7.5, 20, 50, "%", "ctr", "ctr", text_str="Singleplayer",
                                           rrr=h_percent_to_px(5), b_thickness=0, color=MAIN_MENU_BUTTON_COLOR,
                                           font=FontSave.get_font(5),
-                                          icon=load_image("assets/sprites/menu icons/singleplayer.png"),
+                                          icon=get_menu_icon("singleplayer"),
                                           icon_size=0.6, text_align="bottom", icon_align="middle", text_align_offset=0.04,
                                           command=self.singleplayer_click)
 
         self.multiplayer_button = Button(self, 11, -7.5, 20, 50, "%", "ctr", "ctr", text_str="Multiplayer",
                                          rrr=h_percent_to_px(5), b_thickness=0, color=MAIN_MENU_BUTTON_COLOR,
                                          font=FontSave.get_font(5),
-                                         icon=load_image("assets/sprites/menu icons/multiplayer.png"),
+                                         icon=get_menu_icon("multiplayer"),
                                          icon_size=0.6, text_align="bottom", icon_align="middle", text_align_offset=0.04,
                                          command=self.multiplayer_click)
 
         self.settings_button = Button(self, -11, 25, 20, 10, "%", "ctr", "ctr", text_str="Settings",
                                       b_thickness=0, color=MAIN_MENU_BUTTON_COLOR, font=FontSave.get_font(5),
-                                      icon=load_image("assets/sprites/menu icons/settings.png"), icon_size=0.8,
+                                      icon=get_menu_icon("settings"), icon_size=0.8,
                                       command=self.settings_click)
 
         self.quit_button = Button(self, 11, 25, 20, 10, "%", "ctr", "ctr", text_str="Quit",
                                   b_thickness=0, color=MAIN_MENU_BUTTON_COLOR, font=FontSave.get_font(5),
-                                  icon=load_image("assets/sprites/menu icons/quit.png"), icon_size=0.8,
+                                  icon=get_menu_icon("quit"), icon_size=0.8,
                                   command=self.app.quit)
 
         # endregion
 
         self.hide_by_fade = [self.singleplayer_button, self.multiplayer_button, self.settings_button, self.quit_button,
-                             self.version_text, self.copyright_text, self.copyright_text_sub]
+                             self.version_text, self.copyright_text]
+
+        for widget in (self.logo, self.version_text, self.copyright_text):
+            widget.is_static = True
 
         self.hide_by_move = [self.logo, self.name_textbox, self.profile_pic]
-        self.hide_by_move_pos = [x.get_pos("px", "tl", "ctr") for x in self.hide_by_move]
+        self.hide_by_move_pos: tuple[Vector2, ...] or None = None
+        """The original positions of the widgets in `hide_by_move`, computed on the first `set_shown_by_move` call."""
 
         if startup_sequence:
             self.startup_sequence()
 
+    @staticmethod
+    def render_copyright_text() -> pygame.Surface:
+        """
+        Render the two lines of the copyright text onto one right aligned surface, so that they are drawn as a single
+        widget. The baseline of the first line is 3.5% of the screen height above the second line's.
+        """
+        line_1 = FontSave.render(3, COPYRIGHT_TEXT, "white")
+        line_2 = FontSave.render(3, COPYRIGHT_TEXT_SUB, "white")
+        line_gap = h_percent_to_px(3.5)
+
+        w = max(line_1.get_width(), line_2.get_width())
+        h = max(line_2.get_height(), int(line_gap + line_1.get_height()))
+
+        surface = pygame.Surface((w, h), pygame.SRCALPHA)
+        surface.blit(line_1, (w - line_1.get_width(), h - line_gap - line_1.get_height()))
+        surface.blit(line_2, (w - line_2.get_width(), h - line_2.get_height()))
+
+        return surface.convert_alpha()
+
     """
     Start-up sequence
     """
@@ -113,16 +133,16 @@ class MainMenuScene(Scene):
 
         self.welcome_text = WelcomeText(self, 0, 0, 50, 50, "%", "ctr", "ctr")
 
-        app_timer.Sequence([
-            1.5, self.app.background_scene.move_on_startup,
+        app_timer.Sequence.from_pairs([
+            (1.5, self.app.background_scene.move_on_startup),
 
-            2, lambda: self.welcome_text.fade_anim(1.5, 0),
+            (2, lambda: self.welcome_text.fade_anim(1.5, 0)),
 
-            1, lambda: app_async.Coroutine(self.set_shown_by_fade(True, 0.5, 0.1)),
-               lambda: app_async.Coroutine(self.set_shown_by_move(True, 0.5, 0.1)),
+            (1, [lambda: app_async.Coroutine(self.set_shown_by_fade(True, 0.5, 0.1)),
+                 lambda: app_async.Coroutine(self.set_shown_by_move(True, 0.5, 0.1))]),
 
-            1.5, lambda: self.welcome_text.delete("welcome_text"),
-                 lambda: setattr(self.app, "solid_bg_color", "#123456")
+            (1.5, [lambda: self.welcome_text.delete("welcome_text"),
+                   lambda: setattr(self.app, "solid_bg_color", "#123456")])
         ])
 
     def set_shown_by_fade(self, shown: bool, duration: float, interval: float):
@@ -135,6 +155,9 @@ class MainMenuScene(Scene):
                 yield interval
 
     def set_shown_by_move(self, shown: bool, duration: float, interval: float):
+        if self.hide_by_move_pos is None:
+            self.hide_by_move_pos = tuple(x.get_pos("px", "tl", "ctr") for x in self.hide_by_move)
+
         for widget, pos in zip(self.hide_by_move, self.hide_by_move_pos):
             if shown:
                 widget.move_anim(duration, pos, "px", "tl", "ctr", interpolation=ease_out)
@@ -1,7 +1,7 @@
 from app.audio import MusicPlayer
 from app.scenes.game_scene import GameScene
 from app.scenes.scene import Scene
-from app.shared import load_image
+from app.shared import get_menu_icon
 from app.tools import app_async
 from app.widgets.basic.button import CircularButton, Button
 from online.client.client_comms import ClientComms
@@ -11,20 +11,22 @@ from app.rules_interface.multiplayer import MultiplayerGame
 
 class MultiplayerMenuScene(Scene):
     def __init__(self, app):
-        # super().__init__(app, "multiplayer")
-        super().__init__(app)
-
-        ClientComms.connect()
+        super().__init__(app, "multiplayer")
 
         self.back_button = CircularButton(self, 1.5, 1.5, 4, "%h", "tl", "tl",
                                           command=self.back,
-                                          icon=load_image("assets/sprites/menu icons/back.png"),
+                                          icon=get_menu_icon("back"),
                                           icon_size=0.8)
 
         self.join_button = Button(self, 0, 0, 20, 20, "%", "ctr", "ctr",
                                   command=lambda: self.join("AAAA"),
                                   text_str="JOIN GAME RAHHHH")
 
+    def on_enter(self):
+        # The scene is cached, so the connection is (re)attempted every time the scene is entered instead of on init.
+        if not ClientComms.online:
+            ClientComms.connect()
+
     @app_async.run_as_serial_coroutine
     def join(self, room_code):
         response = yield from ClientComms.send_request(f"join {room_code}")
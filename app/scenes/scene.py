@@ -33,11 +33,76 @@ class Scene:
         self.mouse_listeners: list["MouseListener"] = []
         self.keyboard_listeners: list["KeyboardListener"] = []
 
-    def update(self, dt):
+    def on_enter(self):
+        """
+        Called by the app every time the scene becomes the current scene, whether the scene is newly created or reused
+        from the scene cache.
+        """
+        pass
+
+    def update(self, dt, skip_draw=False) -> list[pygame.Rect]:
+        """
+        Update and draw the scene.
+
+        :param skip_draw: If set to True, the scene is updated but not drawn, e.g. when it would be fully covered by
+                          another scene anyway.
+
+        :return: A list of the rects on the display that have been drawn on, including the areas of sprites that have
+                 moved or have been removed since the previous update.
+        """
         self.anim_group.update(dt)
 
         self.all_sprites.update(dt)
-        self.all_sprites.draw(self.app.display_surface)
+
+        if skip_draw:
+            return []
+
+        return self.draw()
+
+    def draw(self) -> list[pygame.Rect]:
+        """
+        Draw all the sprites of the scene onto the display surface, in the same way as `LayeredUpdates.draw`.
+
+        The difference is in the returned dirty rects: static widgets (see `AutoSprite.is_static`) that haven't moved,
+        faded, or changed their image since the previous draw are drawn, but their areas are not included. Sprites with
+        an alpha of 0 and sprites outside the display are skipped entirely.
+        """
+        surface_blit = self.app.display_surface.blit
+        display_rect = self.app.display_surface.get_rect()
+        spritedict = self.all_sprites.spritedict
+
+        dirty_rects = self.all_sprites.lostsprites  # Areas of sprites that have been removed.
+        self.all_sprites.lostsprites = []
+
+        for sprite in self.all_sprites.sprites():
+            old_rect = spritedict[sprite]
+
+            if sprite.image.get_alpha() == 0 or not display_rect.colliderect(sprite.rect):
+                # Fully transparent sprites (e.g. the overlay fader or faded out widgets) and sprites that are entirely
+                # off the display (e.g. the main menu widgets hidden by moving them up) are not blitted.
+                if old_rect:
+                    dirty_rects.append(old_rect)
+                    spritedict[sprite] = pygame.Rect(0, 0, 0, 0)
+                continue
+
+            new_rect = spritedict[sprite] = surface_blit(sprite.image, sprite.rect)
+
+            if sprite.is_static:
+                draw_state = (sprite.image, sprite.image.get_alpha())
+
+                if new_rect == old_rect and draw_state == sprite.last_draw_state:
+                    continue  # Same image on the same place as the previous draw.
+
+                sprite.last_draw_state = draw_state
+
+            if old_rect and new_rect.colliderect(old_rect):
+                dirty_rects.append(new_rect.union(old_rect))
+            else:
+                dirty_rects.append(new_rect)
+                if old_rect:
+                    dirty_rects.append(old_rect)
+
+        return dirty_rects
 
     def broadcast_keyboard(self, event: pygame.event.Event):
         for listener in self.keyboard_listeners:
@@ -47,6 +112,13 @@ class Scene:
         for listener in self.mouse_listeners[::-1]:
             listener.receive_mouse_event(event)
 
+    @property
+    def idle(self) -> bool:
+        """
+        True if nothing in the scene would change without any user input, i.e. there are no running animations.
+        """
+        return not self.anim_group.animations
+
     @property
     def rect(self):
         return pygame.Rect(0, 0, *pygame.display.get_window_size())
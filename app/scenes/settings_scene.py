@@ -2,7 +2,7 @@ import pygame
 
 from app import app_settings, audio
 from app.scenes.scene import Scene
-from app.shared import load_image
+from app.shared import get_menu_icon
 from app.widgets.basic.button import CircularButton
 from app.widgets.basic.game_bg import GameBackground
 from app.widgets.menu.setting_panel import SettingPanel, SettingEntry
@@ -32,7 +32,7 @@ class SettingsScene(Scene):
         """
         self.back_button = CircularButton(self, 1.5, 1.5, 4, "%h", "tl", "tl",
                                           command=self.back,
-                                          icon=load_image("assets/sprites/menu icons/back.png"),
+                                          icon=get_menu_icon("back"),
                                           icon_size=0.8)
 
     def back(self):
@@ -1,7 +1,9 @@
+import pygame
+
 from app import app_settings
-from app.animations.interpolations import ease_out
+from app.animations.interpolations import ease_out_power
 from app.scenes.scene import Scene
-from app.shared import Layer, func_timer
+from app.shared import Layer
 from app.widgets.basic.fps_counter import FPSCounter
 from app.widgets.basic.game_bg import GameBackground
 from app.widgets.widget import Widget
@@ -12,6 +14,7 @@ class OverlayScene(Scene):
         super().__init__(app, "")
 
         self.fader = Widget(self, 0, 0, 100, 100, "%", "tl", "tl")
+        self.fader.image = pygame.Surface(self.fader.rect.size).convert()  # Opaque surface: no per-pixel alpha.
         self.fader.image.fill((0, 0, 0))
         self.fader.image.set_alpha(0)
 
@@ -30,10 +33,10 @@ class BackgroundScene(Scene):
 
         self.app.background_scene.background.set_pos(0, -100, "%", "mb", "mb")
         self.app.background_scene.background.move_anim(3, (0, 0), "px", "ctr", "ctr",
-                                                       interpolation=lambda x: ease_out(x, power=2.5))
+                                                       interpolation=ease_out_power(2.5))
         self.app.background_scene.background.fade_anim(4, 254)
         # Setting the background's alpha to 255 drops the FPS a lot, but setting it anywhere below 255 doesn't, for some
         # weird reason.
 
-    def update(self, dt):
-        super().update(dt)
+    def update(self, dt, skip_draw=False):
+        return super().update(dt, skip_draw)
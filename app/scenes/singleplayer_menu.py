@@ -3,7 +3,7 @@ import pygame.image
 from app.audio import MusicPlayer
 from app.scenes.game_scene import GameScene
 from app.scenes.scene import Scene
-from app.shared import FontSave, load_image
+from app.shared import FontSave, get_menu_icon, get_action_icon
 from app.tools.settings_data import FieldType
 from app.widgets.basic.button import Button, CircularButton
 from app.widgets.menu.setting_panel import SettingPanel
@@ -44,12 +44,12 @@ class SingleplayerMenuScene(Scene):
         self.start_button = Button(self, 37.5, 37.5, 20, 8, "%", "ctr", "br",
                                    text_str="Start Game", command=self.start,
                                    font=FontSave.get_font(6), color=(126, 237, 139),
-                                   icon=load_image("assets/sprites/action icons/confirm bet.png"),
+                                   icon=get_action_icon("confirm bet"),
                                    icon_size=0.8, icon_align="right")
 
         self.back_button = CircularButton(self, 1.5, 1.5, 4, "%h", "tl", "tl",
                                           command=self.back,
-                                          icon=load_image("assets/sprites/menu icons/back.png"),
+                                          icon=get_menu_icon("back"),
                                           icon_size=0.8)
 
     def start(self):
@@ -28,6 +28,10 @@ VERSION_TEXT = "Allin v0.5.0"
 if not getattr(sys, "frozen", False):
     VERSION_TEXT += " (Uncompiled/Development Build)"
 
+PROFILING = bool(os.getenv("ALLIN_PROFILING"))
+"""If set to True (by setting the `ALLIN_PROFILING` environment variable), functions decorated with `func_timer` print
+how long they take to run. Otherwise, `func_timer` leaves the functions as they are."""
+
 SAVE_FOLDER_PATH = os.path.join(os.getenv("localappdata"), "Allin") if os.getenv("localappdata") else "./save"
 if not os.path.isdir(SAVE_FOLDER_PATH):
     os.mkdir(SAVE_FOLDER_PATH)
@@ -43,8 +47,10 @@ class FontSave:
     """
 
     DEFAULT_FONT_PATH = "assets/fonts/coolvetica condensed rg.ttf"
+    TEXT_CACHE_LIMIT = 256
 
     font_dict = {}
+    text_cache: dict[tuple, pygame.Surface] = {}
 
     @staticmethod
     def get_font(size, unit="%"):
@@ -58,14 +64,44 @@ class FontSave:
         if unit == "px":
             size = size / pygame.display.get_window_size()[1] * 100
 
-        return FontSave.font_dict.setdefault(
-            size,
-            pygame.font.Font(FontSave.DEFAULT_FONT_PATH, int(h_percent_to_px(size)))
-        )
+        font = FontSave.font_dict.get(size)
+        if font is None:
+            font = FontSave.font_dict[size] = pygame.font.Font(FontSave.DEFAULT_FONT_PATH, int(h_percent_to_px(size)))
+
+        return font
+
+    @staticmethod
+    def render(size, text: str, color) -> pygame.Surface:
+        """
+        Render a text with the shared font of the given size (in % height). Rendered texts are cached, so rendering the
+        same text again only makes a copy of the cached surface. A copy is returned so that the caller is free to
+        modify it (e.g. change its alpha on a fade animation).
+
+        :param size: The size of the font in % height.
+        :param text: The text to render.
+        :param color: The color of the text. Must be hashable (e.g. a string or a tuple).
+        """
+        key = (size, text, color)
+        surface = FontSave.text_cache.get(key)
+
+        if surface is None:
+            if len(FontSave.text_cache) >= FontSave.TEXT_CACHE_LIMIT:
+                FontSave.text_cache = {}
+
+            surface = FontSave.text_cache[key] = FontSave.get_font(size).render(text, True, color).convert_alpha()
+
+        return surface.copy()
 
     @staticmethod
     def reset():
         FontSave.font_dict = {}
+        FontSave.text_cache = {}
+        image_cache.clear()
+        icon_cache.clear()
+
+
+image_cache: dict[tuple, pygame.Surface] = {}
+"""Cache of the images loaded by `load_image`, keyed by the arguments of the call."""
 
 
 def load_image(path: str,
@@ -86,8 +122,15 @@ def load_image(path: str,
                     1 - Convert the image using `convert_alpha`
                     2 - Convert the image using `convert`
 
-    :return: The loaded and converted image.
+    :return: The loaded and converted image. Images are cached after being loaded, scaled, and converted once, so later
+             calls with the same arguments return a copy of the cached image without reading the file again.
     """
+    key = (path, tuple(size) if size else None, convert)
+    cached_image = image_cache.get(key)
+
+    if cached_image is not None:
+        return cached_image.copy()
+
     image = pygame.image.load(path)
 
     if size:
@@ -102,14 +145,94 @@ def load_image(path: str,
         elif h <= 0:
             h = int(w / aspect_ratio)
 
-        image = pygame.transform.smoothscale(image, (w, h))
+        if (w, h) != image.get_size():
+            image = pygame.transform.smoothscale(image, (w, h))
 
     if convert == 1:
         image = image.convert_alpha()
     elif convert == 2:
         image = image.convert()
 
-    return image
+    image_cache[key] = image
+    return image.copy()
+
+
+MENU_ICONS_DIR = "assets/sprites/menu icons"
+"""The directory of the menu icon images."""
+
+ACTION_ICONS_DIR = "assets/sprites/action icons"
+"""The directory of the action icon images."""
+
+icon_cache: dict[str, pygame.Surface] = {}
+"""The icons loaded by `get_icon`, keyed by the path of the icon."""
+
+
+def get_icon(path: str) -> pygame.Surface:
+    """
+    Get an icon image. Each icon is loaded and converted once, on the first call with its path, since the display must
+    already exist for `convert_alpha` to work.
+
+    Unlike `load_image`, the shared icon surface itself is returned instead of a copy, so it must not be modified. Icons
+    passed to buttons are fine, as buttons make a scaled copy of the icon.
+    """
+    icon = icon_cache.get(path)
+    if icon is None:
+        icon = icon_cache[path] = load_image(path)
+
+    return icon
+
+
+def get_menu_icon(name: str) -> pygame.Surface:
+    """
+    Get a shared menu icon by its name, e.g. "back" for "assets/sprites/menu icons/back.png". See `get_icon`.
+    """
+    return get_icon(f"{MENU_ICONS_DIR}/{name}.png")
+
+
+def get_action_icon(name: str) -> pygame.Surface:
+    """
+    Get a shared action icon by its name, e.g. "fold" for "assets/sprites/action icons/fold.png". See `get_icon`.
+    """
+    return get_icon(f"{ACTION_ICONS_DIR}/{name}.png")
+
+
+"""
+Sprite groups
+"""
+class FastGroup(pygame.sprite.Group):
+    """
+    A sprite group that keeps its sprites in a list alongside the sprite dict. The dict is still used for membership
+    tests, while the list keeps the order in which the sprites are added.
+
+    Unlike `pygame.sprite.Group`, the `sprites` method returns the underlying list instead of a new copy, so that
+    iterating and indexing the group (e.g. `group.sprites()[i]`) doesn't create a new list every time. The returned list
+    must not be modified, and the group must not be modified while iterating over it.
+    """
+    def __init__(self, *sprites):
+        self.sprite_list: list[pygame.sprite.Sprite] = []
+        super().__init__(*sprites)
+
+    def sprites(self) -> list[pygame.sprite.Sprite]:
+        return self.sprite_list
+
+    def __iter__(self):
+        return iter(self.sprite_list)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.sprite_list.append(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.sprite_list.remove(sprite)
+
+    def empty(self):
+        # The base method iterates over `sprites()` while removing from it, which would skip sprites of the list.
+        for sprite in self.sprite_list:
+            super().remove_internal(sprite)
+            sprite.remove_internal(self)
+
+        self.sprite_list = []
 
 
 """
@@ -157,8 +280,12 @@ def elementwise_mult(a: Iterable, b: Iterable) -> Generator:
 
 def func_timer(func):
     """
-    A decorator function that measures the time taken to run a function
+    A decorator function that measures the time taken to run a function. Only active when `PROFILING` is True; otherwise
+    the function is returned undecorated, so that there is no overhead at all.
     """
+    if not PROFILING:
+        return func
+
     def wrapper(*args, **kwargs):
         time_before = time.perf_counter()
         ret = func(*args, **kwargs)  # Call function
@@ -1,9 +1,14 @@
+import math
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from app.tools.app_timer import TimingUtility, TimerGroup
 from app.shared import *
 
+executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="allin-io")
+"""The shared thread pool that runs the tasks of ThreadWaiter objects."""
+
 
 class Coroutine(TimingUtility):
     """
@@ -12,7 +17,9 @@ class Coroutine(TimingUtility):
 
     For the generator function to pause, it must yield a number (int or float) that represents how many seconds the
     function will wait. Another way is to yield a ThreadWaiter object, where the coroutine will wait until the task of
-    the ThreadWaiter is complete.
+    the ThreadWaiter is complete. A coroutine can also yield another Coroutine object to wait until it finishes (see
+    `app_await`), or a `threading.Event` object to wait until the event is set (e.g. by another thread). To wait for an
+    event with a timeout, yield an EventWaiter object instead.
     """
 
     def __init__(self, target: Generator[int or float or "ThreadWaiter", Any, Any], group: None or "TimerGroup" = None):
@@ -27,66 +34,142 @@ class Coroutine(TimingUtility):
         super().__init__(group)
 
         self.thread_waiter: ThreadWaiter or None = None
+        self.waited_event: threading.Event or None = None
+        self.waited_event_deadline = math.inf
+        """The `time.monotonic` time at which the coroutine stops waiting for `waited_event` even if it isn't set."""
         self.generator_iter = iter(target)
 
         self.ret_value = None
+        self.done_callbacks: list[Callable[[], Any]] = []
+
+    def add_done_callback(self, callback: Callable[[], Any]):
+        """
+        Add a function to be called once when the coroutine finishes. If the coroutine has already finished, then the
+        function is called right away.
+        """
+        if self.finished:
+            callback()
+        else:
+            self.done_callbacks.append(callback)
 
     def on_delay_finish(self):
         if self.thread_waiter and not self.thread_waiter.finished:
             return
+        elif self.waited_event:
+            if not self.waited_event.is_set() and time.monotonic() < self.waited_event_deadline:
+                return
+
+            self.waited_event = None
 
         try:
             ret = next(self.generator_iter)
         except StopIteration as e:
             self.finished = True
             self.ret_value = e.value
+
+            for callback in self.done_callbacks:
+                callback()
             return
 
         if not ret:
-            pass
-        elif type(ret) is int or type(ret) is float:
-            self.delay_left += ret
-        elif type(ret) is ThreadWaiter:
-            self.thread_waiter = ret
-        else:
+            return
+
+        handler = YIELD_HANDLERS.get(type(ret))
+        if not handler:
             raise TypeError(f"invalid yield return value from the coroutine's generator: {ret}")
 
+        handler(self, ret)
+
+    def add_delay(self, delay: int or float):
+        self.delay_left += delay
+
+    def set_thread_waiter(self, thread_waiter: "ThreadWaiter"):
+        self.thread_waiter = thread_waiter
+
+    def set_waited_event(self, event: threading.Event, timeout: float = math.inf):
+        """
+        Wait until the given event is set, or until `timeout` seconds have passed. The event is checked on every tick
+        from the main thread, so waiting doesn't take up a worker thread.
+        """
+        self.waited_event = event
+        self.waited_event_deadline = time.monotonic() + timeout
+
+    def set_event_waiter(self, event_waiter: "EventWaiter"):
+        self.set_waited_event(event_waiter.event, event_waiter.timeout)
+
+    def await_coroutine(self, coroutine: "Coroutine"):
+        """
+        Sleep until the given coroutine finishes. Instead of checking the other coroutine on every tick, this coroutine
+        is not updated at all until it is woken up by the other coroutine's done callback.
+        """
+        self.delay_left = math.inf
+        coroutine.add_done_callback(self.wake_up)
+
+    def wake_up(self):
+        self.delay_left = 0.0
+
+        if self.group:
+            self.last_update = self.group.time
+            self.group.schedule(self, self.group.time)
+
 
 class ThreadWaiter:
     """
-    The ThreadWaiter class is used to call a function from a coroutine and run it on a new thread. When the coroutine
-    yields the ThreadWaiter object, the coroutine waits until the thread is finished executing. The return value of the
+    The ThreadWaiter class is used to call a function from a coroutine and run it on a worker thread. When the coroutine
+    yields the ThreadWaiter object, the coroutine waits until the task is finished executing. The return value of the
     threaded function can then be retreived from the `task_result` property.
+
+    Tasks are run on the worker threads of the shared `executor` instead of spawning a new thread for every task.
     """
     def __init__(self, task: Callable, args=(), auto_start=True):
-        self._finished = False
-
         self.task = task
         self._args = args
 
-        self._task_thread = threading.Thread(target=self._thread_run)
-        self._task_result = None
+        self._future: Future or None = None
 
         if auto_start:
             self.start()
 
     def start(self):
-        self._task_thread.start()
-
-    def _thread_run(self):
-        self._task_result = self.task(*self._args)
-        self._finished = True
+        if not self._future:
+            self._future = executor.submit(self.task, *self._args)
 
     @property
     def task_result(self):
-        return self._task_result
+        """
+        The return value of the task. If the task raised an exception, then the exception is re-raised here.
+        """
+        return self._future.result() if self._future else None
 
     @property
     def finished(self):
-        return self._finished
+        return self._future is not None and self._future.done()
 
 
-func_coroutine_running: dict[Callable, bool] = {}
+class EventWaiter:
+    """
+    An EventWaiter is yielded by a coroutine to wait until a `threading.Event` is set, like yielding the event itself,
+    but the coroutine gives up waiting once the timeout has passed. Check `event.is_set()` afterwards to see whether the
+    wait timed out.
+    """
+    def __init__(self, event: threading.Event, timeout: float):
+        self.event = event
+        self.timeout = timeout
+
+
+YIELD_HANDLERS: dict[type, Callable[[Coroutine, Any], None]] = {
+    int: Coroutine.add_delay,
+    float: Coroutine.add_delay,
+    ThreadWaiter: Coroutine.set_thread_waiter,
+    Coroutine: Coroutine.await_coroutine,
+    threading.Event: Coroutine.set_waited_event,
+    EventWaiter: Coroutine.set_event_waiter,
+}
+"""Maps the type of a value yielded by a coroutine's generator to the Coroutine method that handles it."""
+
+
+running_serial_funcs: set[Callable] = set()
+"""The generator functions decorated with `run_as_serial_coroutine` that currently have a coroutine running."""
 
 
 def run_as_coroutine(func: Callable[Any, Generator]):
@@ -105,21 +188,24 @@ def run_as_serial_coroutine(func: Callable[Any, Generator]):
     Similar to `run_as_coroutine` but there can only be a maximum of one coroutine running the function at the same time.
     """
     def limited_func(*args, **kwargs):
-        if func_coroutine_running.setdefault(func, False):
+        if func in running_serial_funcs:
             return
 
+        running_serial_funcs.add(func)
         try:
-            func_coroutine_running[func] = True
             yield from func(*args, **kwargs)
         finally:
-            func_coroutine_running[func] = False
+            running_serial_funcs.discard(func)
 
     return run_as_coroutine(limited_func)
 
 
 def app_await(coroutine: Coroutine):
-    # idfk what is this
-    while not coroutine.finished:
-        yield 0
+    """
+    Wait for a coroutine to finish and return its return value. Used inside a coroutine's generator function:
+    `ret_value = yield from app_await(other_coroutine)`.
+    """
+    if not coroutine.finished:
+        yield coroutine
 
     return coroutine.ret_value
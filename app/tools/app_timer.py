@@ -6,9 +6,11 @@ The app timer module contains classes that provides an interface to time and sch
 Instead of running a new thread, The scheduling of function calls are done synchronously to the main thread. This is
 done by updating the timer groups (the global `default_group` and other local timer groups) every game tick.
 """
+import heapq
+import math
 import threading
 from abc import ABC, abstractmethod
-from typing import Callable, Generator, Any
+from typing import Callable, Generator, Any, Iterable
 
 
 class TimingUtility(ABC):
@@ -27,6 +29,11 @@ class TimingUtility(ABC):
         self.finished = False
         self.delay_left = 0.0
 
+        self.last_update = 0.0
+        """The group clock time of when the timer was last updated by its timer group."""
+        self.wake_entry = 0
+        """The sequence number of the timer's current entry in its group's wake heap."""
+
         self.group.add(self)
 
     def update(self, dt):
@@ -76,6 +83,9 @@ class Timer(TimingUtility):
 class Sequence(TimingUtility):
     """
     The Sequence class is used to create a sequence of function calls with set delays between them.
+
+    Internally, the sequence is stored as a tuple of steps. Each step is a pair of a delay and a tuple of functions
+    that are called once the delay is over.
     """
 
     def __init__(self, sequence_list: list[Callable or int or float], group: None or "TimerGroup" = None):
@@ -90,35 +100,68 @@ class Sequence(TimingUtility):
                       placed in the global `default_group`, updated in the game's main loop.
         """
 
+        steps = []
+        delay, actions = 0, []
+
         for x in sequence_list:
-            if not (callable(x) or type(x) is int or type(x) is float):
+            if callable(x):
+                actions.append(x)
+            elif type(x) is int or type(x) is float:
+                if actions:
+                    steps.append((delay, tuple(actions)))
+                    delay, actions = 0, []
+
+                delay += x
+            else:
                 raise ValueError(f"invalid item in sequence list (must be either a callable/function or a number): {x}")
 
+        if actions or delay:
+            steps.append((delay, tuple(actions)))
+
+        self.init_steps(tuple(steps), group)
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[tuple[int or float, Callable or Iterable[Callable]]],
+                   group: None or "TimerGroup" = None) -> "Sequence":
+        """
+        Create a sequence from a list of (delay, function) pairs instead of a flat sequence list. The second item of a
+        pair can also be a list of functions that are called on the same tick.
+
+        e.g. `Sequence.from_pairs([(1, f), (2, [g, h])])` is equivalent to `Sequence([1, f, 2, g, h])`.
+        """
+        sequence = cls.__new__(cls)
+        sequence.init_steps(tuple((delay, (actions,) if callable(actions) else tuple(actions))
+                                  for delay, actions in pairs), group)
+        return sequence
+
+    def init_steps(self, steps: tuple[tuple[int or float, tuple[Callable, ...]], ...], group: None or "TimerGroup"):
         super().__init__(group)
 
-        self.sequence_list = sequence_list
-        self.sequence_iter = iter(self.sequence_list)
+        self.steps = steps
+        self.step_index = 0
+
+        self.delay_left = steps[0][0] if steps else 0.0
 
     def on_delay_finish(self):
         """
-        Once the next action delay reaches zero, then the iterator goes to the next item on the list. If the item is a
-        function, it is called, and if it's a number, it is added to the next action delay.
+        Once the next action delay reaches zero, then the functions of the current step are called and the delay of the
+        next step is added to the next action delay.
 
-        Note that if there are more than one functions in a row in the sequence list, they are run on the same tick.
+        Note that if the delay of a step is zero, then its functions are run on the same tick as the previous step's.
         """
 
         while self.delay_left <= 0:
-            try:
-                action: Callable or int or float
-                action = next(self.sequence_iter)
-            except StopIteration:
+            if self.step_index >= len(self.steps):
                 self.finished = True
                 break
 
-            if callable(action):
+            for action in self.steps[self.step_index][1]:
                 action()
-            else:
-                self.delay_left += action
+
+            self.step_index += 1
+
+            if self.step_index < len(self.steps):
+                self.delay_left += self.steps[self.step_index][0]
 
 
 class TimerGroup:
@@ -131,6 +174,12 @@ class TimerGroup:
     def __init__(self):
         self.timers: list[TimingUtility] = []
 
+        self.time = 0.0
+        """The group clock: the total delta time the group has been updated by."""
+        self.wake_heap: list[tuple[float, int, TimingUtility]] = []
+        """A heap of (wake time, entry number, timer) tuples, sorted by the group clock time of when each timer is due."""
+        self.entry_count = 0
+
     def new_timer(self, delay: float, func: Callable, args=()) -> Timer:
         return Timer(delay, func, args, group=self)
 
@@ -148,6 +197,18 @@ class TimerGroup:
 
         self.timers.append(timer)
 
+        # The delay of a new timer is usually set after it is added, so it is scheduled to be checked immediately.
+        timer.last_update = self.time
+        self.schedule(timer, self.time)
+
+    def schedule(self, timer: TimingUtility, wake_time: float) -> None:
+        """
+        Push a new wake heap entry for the given timer. Older entries of the timer are ignored once they are popped.
+        """
+        self.entry_count += 1
+        timer.wake_entry = self.entry_count
+        heapq.heappush(self.wake_heap, (wake_time, self.entry_count, timer))
+
     def remove(self, timer: TimingUtility) -> None:
         """
         Remove a timer or sequence from the timer group.
@@ -157,13 +218,38 @@ class TimerGroup:
 
     def update(self, dt: float) -> None:
         """
-        Update all the timers and sequences in the timer group.
+        Update the timers, sequences, and coroutines of the timer group that are due on the current tick.
+
+        Instead of updating every timer on every tick, only the timers at the top of the wake heap whose wake time has
+        been reached are popped and updated. Timers that are still due after being updated (e.g. a coroutine waiting
+        for a thread) are checked again on the next tick.
         """
-        for x in self.timers:
-            x.update(dt)
+        self.time += dt
+        recheck = []
+
+        while self.wake_heap and self.wake_heap[0][0] <= self.time:
+            _, entry, x = heapq.heappop(self.wake_heap)
+            if x.group is not self or entry != x.wake_entry:
+                continue
+
+            x.update(self.time - x.last_update)
+            x.last_update = self.time
 
             if x.finished:
                 self.remove(x)
+            elif x.delay_left == math.inf:
+                # A timer with an infinite delay is left out of the heap until it is rescheduled (see
+                # `Coroutine.wake_up`).
+                continue
+            elif self.time + x.delay_left <= self.time:
+                # Still due, or left with a delay too small to move the wake time because of float rounding. Pushing it
+                # back now would pop it again in this same loop with a zero delta time, over and over.
+                recheck.append(x)
+            else:
+                self.schedule(x, self.time + x.delay_left)
+
+        for x in recheck:
+            self.schedule(x, self.time)
 
 
 default_group = TimerGroup()
@@ -1,11 +1,16 @@
 import colorsys
 import random
+from functools import cache
 
 
+@cache
 def hsv_factor(rgb: tuple or str, hf=0, sf=1, vf=1) -> tuple:
     """
     Takes a 24 bit RGB value and changes it according to the given HSV factors (hue, saturation, and value)
 
+    The results are cached, as the same few colors are converted over and over (e.g. the pressed toggle switch thumb is
+    recolored every frame).
+
     :param rgb: The RGB value can be in tuple (e.g. (255, 255, 255)) or a string with the "#RRGGBB" format
 
     :param hf: Hue factor
@@ -28,9 +33,11 @@ def hsv_factor(rgb: tuple or str, hf=0, sf=1, vf=1) -> tuple:
 
 def rand_color() -> tuple:
     """
-    Generates a random color in an (R, G, B) tuple format.
+    Generates a random color in an (R, G, B) tuple format. The three channels are taken from a single 24 bit random
+    number.
     """
-    return tuple(random.randrange(256) for _ in range(3))
+    rgb = random.getrandbits(24)
+    return rgb >> 16, (rgb >> 8) & 0xFF, rgb & 0xFF
 
 
 def mix_color(c1: tuple, c2: tuple, fac=0.5) -> tuple:
@@ -10,6 +10,10 @@ from app.widgets.widget import WidgetComponent
 
 DEFAULT_COLOR = (128, 128, 128)
 
+base_cache: dict[tuple, pygame.Surface] = {}
+"""Cache of pre-rendered rounded rectangle button bases, keyed by the size and appearance of the base. Buttons that look
+the same (e.g. the main menu buttons, which are recreated every time the main menu is opened) share one base surface."""
+
 
 class Button(MouseListener):
     def __init__(self, parent, *rect_args,
@@ -85,6 +89,7 @@ class Button(MouseListener):
 
         self.icon_size = icon_size
         self.icon_align = icon_align
+        self.icon_source: pygame.Surface or None = None
 
         self.set_icon(icon, icon_size)
 
@@ -94,7 +99,15 @@ class Button(MouseListener):
         """
         Draw a rounded rectangle for the button with the set color and border color attributes.
         """
-        draw_rounded_rect(self.base.image, self.base.rect, self.color, self.b_color, self.b_thickness, self.rrr)
+        key = (self.base.rect.size, self.color, self.b_color, self.b_thickness, self.rrr)
+        base = base_cache.get(key)
+
+        if base is None:
+            base = pygame.Surface(self.base.rect.size, pygame.SRCALPHA)
+            draw_rounded_rect(base, base.get_rect(), self.color, self.b_color, self.b_thickness, self.rrr)
+            base = base_cache[key] = base.convert_alpha()
+
+        self.base.image = base
 
     def set_text(self, text_str: str):
         self.text_str = text_str
@@ -111,6 +124,11 @@ class Button(MouseListener):
         self.text.rect = self.text.image.get_rect(center=(x, y))
 
     def set_icon(self, icon: pygame.Surface, size=1.0):
+        if icon and icon is self.icon_source and size == self.icon_size:
+            return  # The same (shared) icon is already shown with the same size, so there's no need to rescale it.
+
+        self.icon_source = icon
+
         if not icon:
             icon = pygame.Surface((1, 1), pygame.SRCALPHA)
             self.icon.image = icon
@@ -1,5 +1,3 @@
-import pygame
-
 from app import app_settings
 from app.shared import load_image
 from app.widgets.widget import Widget
@@ -9,6 +7,5 @@ class GameBackground(Widget):
     def __init__(self, parent, *rect_args):
         super().__init__(parent, *rect_args)
 
-        self.image = pygame.transform.smoothscale(
-            pygame.image.load("assets/sprites/misc/background.png"), self.rect.size
-        ).convert()
+        self.image = load_image("assets/sprites/misc/background.png", self.rect.size, convert=2)
+        self.is_static = True
@@ -10,6 +10,9 @@ PFP_COLORS = [
 
 
 class ProfilePic(Widget):
+    circle_cache: dict[tuple, pygame.Surface] = {}
+    """Cache of the drawn profile picture circles, keyed by the size and color of the circle."""
+
     def __init__(self, parent, *rect_args):
         super().__init__(parent, *rect_args)
 
@@ -19,5 +22,13 @@ class ProfilePic(Widget):
         # TODO add more stuffs, make it customizable
 
     def draw_base(self):
-        r = self.rect.h // 2
-        draw_circle(self.base.image, r, r, r, PFP_COLORS[0])
+        key = (self.base.image.get_size(), PFP_COLORS[0])
+        circle = ProfilePic.circle_cache.get(key)
+
+        if circle is None:
+            circle = ProfilePic.circle_cache[key] = self.base.image.copy()
+
+            r = self.rect.h // 2
+            draw_circle(circle, r, r, r, PFP_COLORS[0])
+
+        self.base.image = circle.copy()
@@ -54,6 +54,7 @@ class Textbox(MouseListener, KeyboardListener):
         self._label_hybrid = label_hybrid
         self._editing = False
         self._caret_blink = 0.0
+        self._caret_alpha = 0
 
         self._text_align = text_align
         self._editing_text_align = editing_text_align if editing_text_align else self._text_align
@@ -69,6 +70,14 @@ class Textbox(MouseListener, KeyboardListener):
         if label_hybrid:
             self.base.image.set_alpha(0)
 
+        self.dim_base_image = self.base.image
+        self.bright_base_image = self.base.image.copy()
+        self.bright_base_image.fill((20, 20, 20), special_flags=pygame.BLEND_ADD)
+        """
+        The base is brightened when hovered or edited. Both versions are drawn once here and swapped on state changes,
+        instead of brightening the whole textbox image every frame.
+        """
+
         self.text = WidgetComponent(self, 0, 0, 0, 0, "px", "ctr", "ctr")
         self.redraw_text()
 
@@ -77,6 +86,12 @@ class Textbox(MouseListener, KeyboardListener):
         self.caret.image.set_alpha(0)
 
         self.underline = WidgetComponent(self, 0, 0, 0, 2, "px", "ctr", "ctr")
+        self.underline_source = pygame.Surface((self.rect.w, 2), pygame.SRCALPHA)
+        self.underline_source.fill(DEFAULT_FG_COLOR)
+        """
+        A full width underline surface. The underline's image is a subsurface of this surface, so resizing the underline
+        while typing doesn't allocate and fill a new surface.
+        """
 
     def redraw_text(self):
         self.text.image = self._font.render(self._text_str, True, DEFAULT_FG_COLOR)
@@ -108,6 +123,7 @@ class Textbox(MouseListener, KeyboardListener):
             return
 
         c = event.unicode
+        prev_text_str = self._text_str
         textbox_not_full = (len(self._text_str) <= self._char_limit and
                             (self._adaptive_char_limit and self.rect.w - self.text.rect.w >= self.rect.h))
 
@@ -124,7 +140,19 @@ class Textbox(MouseListener, KeyboardListener):
         elif textbox_not_full and self._input_validator(c):
             self._text_str += c
 
-        self.redraw_text()
+        if self._text_str != prev_text_str:
+            # Keys that don't change the text (e.g. modifier keys, arrow keys, or typing into a full textbox) don't
+            # re-render the text.
+            self.redraw_text()
+
+    def set_caret_alpha(self, alpha: int):
+        """
+        Set the caret's alpha, skipping the `set_alpha` call when the caret is already at that alpha (the caret only
+        switches between fully shown and hidden twice per blink).
+        """
+        if alpha != self._caret_alpha:
+            self._caret_alpha = alpha
+            self.caret.image.set_alpha(alpha)
 
     def update(self, dt):
         super().update(dt)
@@ -138,8 +166,9 @@ class Textbox(MouseListener, KeyboardListener):
                 if self.underline.rect.w != self.text.rect.w:
                     # Update the underline's size and position
                     self.underline.rect.w = self.text.rect.w
-                    self.underline.image = pygame.Surface(self.underline.rect.size, pygame.SRCALPHA)
-                    self.underline.image.fill(DEFAULT_FG_COLOR)
+                    self.underline.image = self.underline_source.subsurface(
+                        (0, 0, min(self.text.rect.w, self.underline_source.get_width()), 2)
+                    )
 
                 self.underline.set_pos(self.text.rect.centerx, self.text.rect.top + self._font.get_ascent() + 2,
                                        "px", "tl", "mt")
@@ -153,8 +182,9 @@ class Textbox(MouseListener, KeyboardListener):
 
         else:
             # Brighten the textbox
-            if self.hover or self._editing:
-                self.image.fill((20, 20, 20), special_flags=pygame.BLEND_ADD)
+            bright = self.hover or self._editing
+            if bright != (self._prev_hover or self._prev_editing):
+                self.base.image = self.bright_base_image if bright else self.dim_base_image
 
         """
         Caret blinking stuff
@@ -164,10 +194,10 @@ class Textbox(MouseListener, KeyboardListener):
             self._caret_blink %= 1
 
             self.caret.rect.x = self.text.rect.right + 1
-            self.caret.image.set_alpha(255 if self._caret_blink < 0.5 else 0)
+            self.set_caret_alpha(255 if self._caret_blink < 0.5 else 0)
 
         elif self._prev_editing and not self._editing:
-            self.caret.image.set_alpha(0)
+            self.set_caret_alpha(0)
 
         """
         Switching alignment between editing and not editing
@@ -11,6 +11,9 @@ if typing.TYPE_CHECKING:
     from app.scenes.game_scene import GameScene
 
 
+ALL_IN_FRAMES = 60
+"""The number of pre-rendered hues of the rainbow "ALL IN" side text."""
+
 COLORS = {
     "fold": (184, 51, 51),
     "call": (24, 142, 163),
@@ -30,8 +33,15 @@ class ActionButton(Button, ABC):
 
         self.original_pos = Vector2(self.rect.center)
         self.hidden_pos = self.original_pos + Vector2(1.2 * self.rect.width, 0)
+        self.shown = True
 
     def set_shown(self, shown: bool, duration=0.5):
+        moving = self._current_move_anim and self._current_move_anim.running
+        if shown == self.shown and (duration > 0 or not moving):
+            # Already shown/hidden or moving there. Starting another animation would only restart the same movement.
+            return
+
+        self.shown = shown
         new_pos = self.original_pos if shown else self.hidden_pos
         self.move_anim(duration, new_pos, "px", "tl", "ctr", interpolation=ease_out if shown else ease_in)
 
@@ -60,6 +70,10 @@ class SideTextedButton(Button):
     2. BetConfirmButton
     """
 
+    all_in_frames: tuple[pygame.font.Font, list[pygame.Surface]] or None = None
+    """The "ALL IN" side text pre-rendered in `ALL_IN_FRAMES` hues, along with the font used to render them. Shared by
+    all side texted buttons and rendered again when the font changes (e.g. after changing the display resolution)."""
+
     def __init__(self, parent, *rect_args, **kwargs):
         super().__init__(parent, *rect_args,  **kwargs)
 
@@ -74,16 +88,28 @@ class SideTextedButton(Button):
         self.set_side_text(side_text_str, (247, 218, 136))
 
     def set_side_text(self, side_text_str: str, color: tuple):
+        self.set_side_text_image(FontSave.get_font(3).render(side_text_str, True, color))
+
+    def set_side_text_image(self, image: pygame.Surface):
         _, _, w, h = self.rect
 
-        self.side_text.image = FontSave.get_font(3).render(side_text_str, True, color)
+        self.side_text.image = image
         self.side_text.rect = self.side_text.image.get_rect(midright=(w - h / 2, h / 2))
 
-    def update_all_in(self, dt):
-        _, _, w, h = self.rect
+    @staticmethod
+    def get_all_in_frames() -> list[pygame.Surface]:
+        font = FontSave.get_font(3)
+
+        if not SideTextedButton.all_in_frames or SideTextedButton.all_in_frames[0] is not font:
+            frames = [font.render("ALL IN", True, hsv_factor((255, 64, 64), hf=i / ALL_IN_FRAMES))
+                      for i in range(ALL_IN_FRAMES)]
+            SideTextedButton.all_in_frames = font, frames
 
-        color = hsv_factor((255, 64, 64), hf=self.rainbow_fac)
-        self.set_side_text("ALL IN", color)
+        return SideTextedButton.all_in_frames[1]
+
+    def update_all_in(self, dt):
+        frame = int(self.rainbow_fac * ALL_IN_FRAMES) % ALL_IN_FRAMES
+        self.set_side_text_image(self.get_all_in_frames()[frame])
 
         self.rainbow_fac = (self.rainbow_fac + 2 * dt) % 1
 
@@ -97,7 +123,7 @@ class SideTextedButton(Button):
 class FoldButton(ActionButton):
     def __init__(self, parent, *rect_args):
         super().__init__(parent, *rect_args, color=COLORS["fold"], text_str="Fold",
-                         icon=load_image("assets/sprites/action icons/fold.png"), icon_size=0.8)
+                         icon=get_action_icon("fold"), icon_size=0.8)
 
     def command(self):
         self.game_scene.game.action(Actions.FOLD)
@@ -118,10 +144,10 @@ class CallButton(ActionButton, SideTextedButton):
 
         if amount_to_pay > 0:
             self.set_text("Call")
-            self.set_icon(load_image("assets/sprites/action icons/call.png"), 0.9)
+            self.set_icon(get_action_icon("call"), 0.9)
         else:
             self.set_text("Check")
-            self.set_icon(load_image("assets/sprites/action icons/check.png"), 0.8)
+            self.set_icon(get_action_icon("check"), 0.8)
 
         self.all_in = amount_to_pay >= self.player.chips
 
@@ -145,7 +171,7 @@ class RaiseButton(ActionButton):
 
         if self.game_scene.bet_prompt.shown:
             self.set_text("Cancel")
-            self.set_icon(load_image("assets/sprites/action icons/cancel.png"), 0.9)
+            self.set_icon(get_action_icon("cancel"), 0.9)
             self.set_color((100, 100, 100))
         else:
             self.set_text(self.original_text)
@@ -155,10 +181,10 @@ class RaiseButton(ActionButton):
     def update_bet_amount(self, new_bet_amount: int):
         if new_bet_amount > 0:
             self.original_text = "Raise"
-            self.original_icon = load_image("assets/sprites/action icons/raise.png")
+            self.original_icon = get_action_icon("raise")
         else:
             self.original_text = "Bet"
-            self.original_icon = load_image("assets/sprites/action icons/bet.png")
+            self.original_icon = get_action_icon("bet")
 
         self.set_text(self.original_text)
         self.set_icon(self.original_icon, 0.9)
@@ -6,7 +6,7 @@ from app.animations.animation import AnimGroup
 from app.shared import *
 
 from app.animations.var_slider import VarSlider
-from app.animations.interpolations import ease_out
+from app.animations.interpolations import ease_out_power
 from app.widgets.widget import Widget, WidgetComponent, AutoRect
 
 from typing import TYPE_CHECKING
@@ -18,6 +18,37 @@ DEFAULT_HEAD_COLOR = 95, 201, 123
 DEFAULT_SUB_COLOR = 32, 46, 38
 DEFAULT_TEXT_COLOR = 255, 255, 255
 
+base_cache: dict[tuple, pygame.Surface] = {}
+"""Cache of the rounded rectangle surfaces of the sub and head bases, keyed by (component code, size). The surfaces are
+shared by all player displays of the same size, and must not be modified."""
+
+
+MASTER_CIRCLE_SIZE = 512
+"""The size of the high resolution circle that the profile picture circles are scaled down from."""
+
+circle_templates: dict[int, pygame.Surface] = {}
+"""White antialiased circles of different sizes, scaled down from the master circle and keyed by their size. The master
+circle itself is stored with the `MASTER_CIRCLE_SIZE` key."""
+
+
+def get_circle_template(size: int) -> pygame.Surface:
+    """
+    Get a white circle with the given diameter in pixels. Each size is only scaled down from the master circle once. The
+    returned surface is shared and must not be modified.
+    """
+    template = circle_templates.get(size)
+
+    if template is None:
+        master = circle_templates.get(MASTER_CIRCLE_SIZE)
+        if master is None:
+            master = circle_templates[MASTER_CIRCLE_SIZE] = pygame.Surface(2 * (MASTER_CIRCLE_SIZE,), pygame.SRCALPHA)
+            pygame.draw.circle(master, (255, 255, 255), 2 * (MASTER_CIRCLE_SIZE // 2,), MASTER_CIRCLE_SIZE // 2)
+
+        template = circle_templates[size] = pygame.transform.smoothscale(master, (size, size)).convert_alpha()
+
+    return template
+
+
 class ComponentCodes:
     """
     The `Component` class contains constants (codes) to reference components on the `component` dict of the
@@ -35,6 +66,9 @@ class ComponentCodes:
     CHIPS_TEXT = 4
     PROFILE_PIC = 5
 
+    HEAD_STATIC = HEAD_BASE, NAME_TEXT, PROFILE_PIC
+    """The components that are pre-composited into the head composite, as they don't change during animations."""
+
 
 class PlayerDisplay(Widget):
     """
@@ -66,6 +100,8 @@ class PlayerDisplay(Widget):
         Player display components
         """
         self.components = {}
+        self.head_composite: pygame.Surface or None = None
+        """The head base with the name text and profile picture drawn on it. Rebuilt when one of them is redrawn."""
 
         self.pocket_cards = pygame.sprite.Group()  # Note: Pocket cards are separate from player displays.
         self.anim_group = AnimGroup()
@@ -82,6 +118,10 @@ class PlayerDisplay(Widget):
         self.rect_after_move = AutoRect(0, 0, 0, 0)
         # A rect that shows the expected end position of the player display after being moved.
 
+        self.component_redrawers = (self.redraw_sub_base, self.redraw_sub_text, self.redraw_head_base,
+                                    self.redraw_name_text, self.redraw_chips_text, self.redraw_profile_pic)
+        """The redraw method of each component, indexed by the component codes."""
+
         self.init_components()
 
     def init_components(self):
@@ -95,8 +135,7 @@ class PlayerDisplay(Widget):
             self.redraw_component(i)
             self.component_group.add(self.components[i])
 
-        self.image.fill((0, 0, 0, 0))
-        self.component_group.draw(self.image)
+        self.draw_components()
 
     def redraw_component(self, component_code: int):
         # TODO Code the player display's component system from scratch
@@ -104,49 +143,96 @@ class PlayerDisplay(Widget):
         if not 0 <= component_code <= 5:
             raise ValueError(f"component_code must be a constant from the Component class, got: {component_code}")
 
-        w, h = self.rect.width, self.rect.height
-        w_head, h_head = w, 0.7 * h
-        w_sub, h_sub = 0.8 * w, 0.3 * h
+        if component_code in ComponentCodes.HEAD_STATIC:
+            self.head_composite = None
 
         component: WidgetComponent = self.components[component_code]
+        self.component_redrawers[component_code](component)
+
+    """
+    Component redrawers, indexed by their component codes in `component_redrawers`
+    """
+    def redraw_sub_base(self, component: WidgetComponent):
+        w_sub, h_sub = 0.8 * self.rect.width, 0.3 * self.rect.height
+        key = (ComponentCodes.SUB_BASE, (w_sub, h_sub))
 
-        match component_code:
-            case ComponentCodes.SUB_BASE:
-                component.image = pygame.Surface((w_sub, h_sub), pygame.SRCALPHA)
-                draw_rounded_rect(component.image, pygame.Rect(0, 0, w_sub, h_sub), color=DEFAULT_SUB_COLOR)
-                component.image.set_alpha(150)
+        if key not in base_cache:
+            base = pygame.Surface((w_sub, h_sub), pygame.SRCALPHA)
+            draw_rounded_rect(base, pygame.Rect(0, 0, w_sub, h_sub), color=DEFAULT_SUB_COLOR)
+            base = base_cache[key] = base.convert_alpha()
+            base.set_alpha(150)
 
-            case ComponentCodes.SUB_TEXT:
-                component.image = FontSave.get_font(3).render(self.sub_text_str, True, DEFAULT_TEXT_COLOR)
+        component.image = base_cache[key]
+        self.position_sub_component(component)
 
-            case ComponentCodes.HEAD_BASE:
-                component.image = pygame.Surface((w_head, h_head), pygame.SRCALPHA)
-                component.rect = component.image.get_rect(center=(w / 2, h_head / 2))
+    def redraw_sub_text(self, component: WidgetComponent):
+        component.image = FontSave.get_font(3).render(self.sub_text_str, True, DEFAULT_TEXT_COLOR)
+        self.position_sub_component(component)
 
-                draw_rounded_rect(component.image, pygame.Rect(0, 0, w_head, h_head), color=DEFAULT_HEAD_COLOR, b=0)
+    def redraw_head_base(self, component: WidgetComponent):
+        w, h_head = self.rect.width, 0.7 * self.rect.height
+        key = (ComponentCodes.HEAD_BASE, (w, h_head))
 
-            case ComponentCodes.NAME_TEXT:
-                component.image = FontSave.get_font(3.5).render(self.player_data.name, True, DEFAULT_TEXT_COLOR)
-                component.rect = component.image.get_rect(center=((w + h_head / 2) / 2, 0.25 * h_head))
+        if key not in base_cache:
+            base = pygame.Surface((w, h_head), pygame.SRCALPHA)
+            draw_rounded_rect(base, pygame.Rect(0, 0, w, h_head), color=DEFAULT_HEAD_COLOR, b=0)
+            base_cache[key] = base.convert_alpha()
 
-            case ComponentCodes.CHIPS_TEXT:
-                component.image = FontSave.get_font(3.5).render(f"${self.chips_text_val:,}", True, DEFAULT_TEXT_COLOR)
-                component.rect = component.image.get_rect(center=((w + h_head / 2) / 2, 0.75 * h_head))
+        component.image = base_cache[key]
+        component.rect = component.image.get_rect(center=(w / 2, h_head / 2))
 
-            case ComponentCodes.PROFILE_PIC:
-                r = int(h_head / 2)
+    def redraw_name_text(self, component: WidgetComponent):
+        w, h_head = self.rect.width, 0.7 * self.rect.height
 
-                component.image = pygame.Surface((h_head, h_head), pygame.SRCALPHA)
-                component.rect = component.image.get_rect(center=(r, r))
+        component.image = FontSave.get_font(3.5).render(self.player_data.name, True, DEFAULT_TEXT_COLOR)
+        component.rect = component.image.get_rect(center=((w + h_head / 2) / 2, 0.25 * h_head))
 
-                # Profile pictures are currently circles with a random solid color
-                color = rand_color()
-                pygame.gfxdraw.aacircle(component.image, r, r, r, color)
-                pygame.gfxdraw.filled_circle(component.image, r, r, r, color)
+    def redraw_chips_text(self, component: WidgetComponent):
+        w, h_head = self.rect.width, 0.7 * self.rect.height
 
-        # Sub base and sub text positioning
-        if component_code in (ComponentCodes.SUB_BASE, ComponentCodes.SUB_TEXT):
-            component.rect = component.image.get_rect(center=(w / 2, h_head - h_sub / 2 + self.sub_pos * h_sub))
+        component.image = FontSave.get_font(3.5).render(f"${self.chips_text_val:,}", True, DEFAULT_TEXT_COLOR)
+        component.rect = component.image.get_rect(center=((w + h_head / 2) / 2, 0.75 * h_head))
+
+    def redraw_profile_pic(self, component: WidgetComponent):
+        h_head = 0.7 * self.rect.height
+        r = int(h_head / 2)
+
+        # Profile pictures are currently circles with a random solid color, made by tinting a white circle.
+        component.image = get_circle_template(int(h_head)).copy()
+        component.image.fill(rand_color(), special_flags=pygame.BLEND_RGBA_MULT)
+        component.rect = component.image.get_rect(center=(r, r))
+
+    def position_sub_component(self, component: WidgetComponent):
+        """
+        Position the sub base or the sub text based on the current `sub_pos`.
+        """
+        w, h = self.rect.width, self.rect.height
+        h_head, h_sub = 0.7 * h, 0.3 * h
+
+        component.rect = component.image.get_rect(center=(w / 2, h_head - h_sub / 2 + self.sub_pos * h_sub))
+
+    def draw_components(self):
+        """
+        Draw the components onto the player display's image in the order of their codes. The static head components are
+        drawn as a single head composite, so only the sub components and the chips text are blitted separately.
+
+        The chips text doesn't overlap the profile picture, so drawing it after the composite keeps the same result.
+        """
+        if not self.head_composite:
+            head_base = self.components[ComponentCodes.HEAD_BASE]
+            self.head_composite = head_base.image.copy()
+
+            for code in (ComponentCodes.NAME_TEXT, ComponentCodes.PROFILE_PIC):
+                component = self.components[code]
+                self.head_composite.blit(component.image, component.rect.move(-head_base.rect.x, -head_base.rect.y))
+
+        sub_base, sub_text, head_base, _, chips_text, _ = (self.components[i] for i in range(6))
+
+        self.image.fill((0, 0, 0, 0))
+        self.image.blits(((sub_base.image, sub_base.rect),
+                          (sub_text.image, sub_text.rect),
+                          (self.head_composite, head_base.rect),
+                          (chips_text.image, chips_text.rect)), doreturn=False)
 
     def set_sub_text_anim(self, new_text: str):
         """
@@ -167,7 +253,7 @@ class PlayerDisplay(Widget):
             animation = VarSlider(duration=0.25, start_val=0, end_val=1, setter_func=self.set_sub_pos)
 
         elif not new_text and extended:  # Old text -> Nothing
-            self.sub_text_str = ""
+            self.set_sub_text("")
             animation = VarSlider(duration=0.25, start_val=1, end_val=0, setter_func=self.set_sub_pos)
 
         else:  # Nothing -> Nothing
@@ -183,11 +269,17 @@ class PlayerDisplay(Widget):
         self.redraw_component(ComponentCodes.SUB_TEXT)
 
     def set_sub_pos(self, sub_pos):
+        # Only the positions of the sub components change, so they are moved without being redrawn.
         self.sub_pos = sub_pos
-        self.redraw_component(ComponentCodes.SUB_BASE)
-        self.redraw_component(ComponentCodes.SUB_TEXT)
+        self.position_sub_component(self.sub_base)
+        self.position_sub_component(self.sub_text)
 
     def set_chips_text(self, chips: int or float):
+        # The eased chips animation produces the same integer for many frames near its end, and each of those would
+        # re-render the same text.
+        if int(chips) == self.chips_text_val:
+            return
+
         self.chips_text_val = int(chips)
         self.redraw_component(ComponentCodes.CHIPS_TEXT)
 
@@ -198,7 +290,7 @@ class PlayerDisplay(Widget):
 
         if duration > 0:
             animation = VarSlider(duration, old_chips, new_chips, setter_func=self.set_chips_text,
-                                  interpolation=lambda x: ease_out(x, 3))
+                                  interpolation=ease_out_power(3))
             self.anim_group.add(animation)
 
         else:
@@ -224,8 +316,7 @@ class PlayerDisplay(Widget):
         if self.anim_group.animations:
             # Only update image if there is an animation.
             self.anim_group.update(dt)
-            self.image.fill((0, 0, 0, 0))
-            self.component_group.draw(self.image)
+            self.draw_components()
 
     """
     Component getters using property
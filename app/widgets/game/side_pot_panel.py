@@ -2,7 +2,7 @@ from typing import TYPE_CHECKING
 
 import pygame
 
-from app.animations.interpolations import ease_out
+from app.animations.interpolations import ease_out_power
 from app.animations.var_slider import VarSlider
 from app.shared import FontSave, Layer
 from app.tools.draw import draw_rounded_rect
@@ -52,7 +52,7 @@ class SidePotText(Widget):
 
         animation = VarSlider(duration, self.pot_value, value,
                               setter_func=lambda x: self.set_pot_value(int(x), False),
-                              interpolation=lambda x: ease_out(x, 3))
+                              interpolation=ease_out_power(3))
         self.scene.anim_group.add(animation)
         self.pot_value = value
 
@@ -84,7 +84,7 @@ class PotText(TableText, MouseListener):
     def set_text_anim(self, pot: int):
         animation = VarSlider(0.4, self.pot, pot,
                               setter_func=lambda x: self.set_text(f"${int(x):,}"),
-                              interpolation=lambda x: ease_out(x, 3))
+                              interpolation=ease_out_power(3))
         self.scene.anim_group.add(animation)
 
         self.pot = pot
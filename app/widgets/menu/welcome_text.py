@@ -61,5 +61,5 @@ class WelcomeText(Widget):
             start_pos = Vector2(c.get_pos()) + Vector2(0.25 * self.rect.h, 0).rotate(random.uniform(-180, 180))
 
             c.fade_anim(duration, 255)
-            c.move_anim(duration, c.get_pos(), start_pos=start_pos, interpolation=lambda x: ease_out(x, 3.0))
+            c.move_anim(duration, c.get_pos(), start_pos=start_pos, interpolation=ease_out_power(3.0))
             yield interval
@@ -133,31 +133,36 @@ class AutoRect(pygame.rect.Rect):
         if unit == "px":
             self.x, self.y = x, y
         elif unit == "%":
-            self.x, self.y = elementwise_mult(self.parent_rect.size, (x / 100, y / 100))
+            self.x, self.y = self.parent_rect.w * (x / 100), self.parent_rect.h * (y / 100)
         elif unit == "%w":
-            self.x, self.y = Vector2(x, y) / 100 * self.parent_rect.w
+            self.x, self.y = x / 100 * self.parent_rect.w, y / 100 * self.parent_rect.w
         elif unit == "%h":
-            self.x, self.y = Vector2(x, y) / 100 * self.parent_rect.h
+            self.x, self.y = x / 100 * self.parent_rect.h, y / 100 * self.parent_rect.h
         else:
             raise ValueError(f"invalid pos unit: {unit}")
 
         """
         Validate anchor and pivot 
         """
-        if anchor not in AutoRect.ALIGNMENT_FACTORS:
+        anchor_fac = AutoRect.ALIGNMENT_FACTORS.get(anchor)
+        pivot_fac = AutoRect.ALIGNMENT_FACTORS.get(pivot)
+
+        if not anchor_fac:
             raise ValueError(f"invalid anchor: {anchor}")
-        elif pivot not in AutoRect.ALIGNMENT_FACTORS:
+        elif not pivot_fac:
             raise ValueError(f"invalid pivot: {pivot}")
 
         """
         Align the position according to the anchor and pivot
 
         Pos = Original pos + (Anchor alignment factors * Parent rect size) - (Pivot alignment factors * Dimensions)
+
+        The calculation is done with plain floats instead of vectors, as this is run every time a widget is moved.
         """
-        anchor_offset = Vector2(*elementwise_mult(AutoRect.ALIGNMENT_FACTORS[anchor], self.parent_rect.size))
-        pivot_offset = Vector2(*elementwise_mult(AutoRect.ALIGNMENT_FACTORS[pivot], self.size))
+        parent_w, parent_h = self.parent_rect.size
 
-        self.x, self.y = Vector2(self.topleft) + anchor_offset - pivot_offset
+        self.x, self.y = (self.x + anchor_fac[0] * parent_w - pivot_fac[0] * self.w,
+                          self.y + anchor_fac[1] * parent_h - pivot_fac[1] * self.h)
 
     def get_pos(self, unit=None, anchor=None, pivot=None) -> Vector2:
         """
@@ -166,22 +171,22 @@ class AutoRect(pygame.rect.Rect):
         """
 
         unit = unit if unit else self._unit
-        anchor = anchor if anchor else self._anchor
-        pivot = pivot if pivot else self._pivot
+        anchor_fac = AutoRect.ALIGNMENT_FACTORS[anchor if anchor else self._anchor]
+        pivot_fac = AutoRect.ALIGNMENT_FACTORS[pivot if pivot else self._pivot]
+
+        parent_w, parent_h = self.parent_rect.size
 
-        anchor_offset = Vector2(*elementwise_mult(AutoRect.ALIGNMENT_FACTORS[anchor], self.parent_rect.size))
-        pivot_offset = Vector2(*(elementwise_mult(AutoRect.ALIGNMENT_FACTORS[pivot], self.size)))
-        pos = Vector2(self.topleft) - anchor_offset + pivot_offset
+        x = self.x - anchor_fac[0] * parent_w + pivot_fac[0] * self.w
+        y = self.y - anchor_fac[1] * parent_h + pivot_fac[1] * self.h
 
         if unit == "%":
-            pos.x = (pos.x / self.parent_rect.w) * 100
-            pos.y = (pos.y / self.parent_rect.h) * 100
+            x, y = (x / parent_w) * 100, (y / parent_h) * 100
         elif unit == "%w":
-            pos = pos / self.parent_rect.w * 100
+            x, y = x / parent_w * 100, y / parent_w * 100
         elif unit == "%h":
-            pos = pos / self.parent_rect.h * 100
+            x, y = x / parent_h * 100, y / parent_h * 100
 
-        return pos
+        return Vector2(x, y)
 
     def set_size(self, w, h):
         prev_pos = self.get_pos("px")
@@ -251,6 +256,12 @@ class AutoSprite(pygame.sprite.Sprite, ABC):
 
         self.parent = parent
 
+        self.is_static = False
+        """If set to True, the widget's image is assumed to never change its contents in place; it only changes by
+        being moved, faded (alpha), or replaced. The scene then leaves the widget's area out of the display update
+        while none of those happen. Only applies to root widgets (widgets that are drawn directly by the scene)."""
+        self.last_draw_state: Optional[tuple] = None  # (image, alpha) of a static widget when it was last drawn.
+
     def delete(self, parent_attribute_name=""):
         if parent_attribute_name:
             setattr(self.parent, parent_attribute_name, None)
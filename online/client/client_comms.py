@@ -4,10 +4,12 @@ online/client/client_comms.py
 The client comms module is the bridge for the game client to the server.
 """
 
+import itertools
+import logging
 import socket
 import threading
-import time
-from typing import Generator, Optional
+from collections import deque
+from typing import BinaryIO, Generator, Optional
 
 from typing import TYPE_CHECKING
 
@@ -27,6 +29,17 @@ from online.data.packets import Packet, PacketTypes
 HOST = "localhost"  # Temporary server address config
 PORT = 32727
 
+READ_BUFFER_SIZE = 65536
+"""The buffer size of the client socket's reader in bytes."""
+
+RESPONSE_TIMEOUT = 3
+"""How many seconds `send_request` waits for the server's basic response before timing out."""
+
+
+logger = logging.getLogger(__name__)
+"""Logger for messages that are too frequent for `log`, such as received game events. Disabled unless the logging level
+is set to DEBUG."""
+
 
 def log(*message):
     print("[Comms Log]", *message)
@@ -35,16 +48,30 @@ def log(*message):
 # Static class
 class ClientComms:
     client_socket: socket.socket = None
+    reader: BinaryIO or None = None
+    """A buffered reader of the client socket, used by the receive thread."""
 
     online: bool = False
     connecting: bool = False
-
-    request_queue: list[int] = []
-    last_response: str = ""
+    connection_number: int = 0
+    """Incremented on every successful connection. A request that was sent on an older connection can't get a response
+    anymore."""
+
+    pending_requests: dict[int, tuple[threading.Event, list[str]]] = {}
+    """The basic requests waiting for a response, keyed by their request IDs. Each request has an event that is set when
+    the request should stop waiting, and a list that the response is appended to by the receive thread. Entries are only
+    removed by the requests themselves (or all at once on reconnection)."""
+    request_ids = itertools.count(1)
+    """Generates the request IDs, which the server copies into its basic responses."""
+    send_lock: threading.Lock = threading.Lock()
+    """Prevents packets sent from different threads at the same time from being interleaved in the socket."""
+
+    outbound_queue: deque[Packet] = deque()
+    """Packets queued with `queue_packet`, to be sent together on the next `flush_packets` call."""
 
     app: Optional["App"] = None
     current_game: "MultiplayerGame" = None
-    game_event_queue: list[GameEvent or GameSyncEvent] = []
+    game_event_queue: deque[GameEvent or GameSyncEvent] = deque()
 
     @staticmethod
     def connect(threaded=True):
@@ -59,10 +86,16 @@ class ClientComms:
 
         try:
             ClientComms.client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            ClientComms.client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             ClientComms.client_socket.connect((HOST, PORT))
+            ClientComms.reader = ClientComms.client_socket.makefile("rb", buffering=READ_BUFFER_SIZE)
 
             ClientComms.online = True
-            ClientComms.request_queue = []
+            ClientComms.connection_number += 1
+            for response_event, _ in ClientComms.pending_requests.values():
+                response_event.set()  # Wake up the requests left from the previous connection, so that they can give up.
+            ClientComms.pending_requests = {}
+            ClientComms.outbound_queue = deque()
             log(f"Connected to {HOST}")
             threading.Thread(target=ClientComms.receive, daemon=True).start()
 
@@ -81,25 +114,33 @@ class ClientComms:
             ClientComms.app.leave_game()
 
         ClientComms.client_socket = None
+        ClientComms.reader = None
         ClientComms.online = False
 
         log("Disconnected.")
 
     @staticmethod
     def receive():
+        reader = ClientComms.reader
+
         try:
             while True:
-                packet: packets.Packet = packets.receive_packet(ClientComms.client_socket)
+                packet: packets.Packet = packets.read_packet(reader)
 
                 if not packet:
                     break
 
                 match packet.packet_type:
                     case PacketTypes.BASIC_RESPONSE:
-                        ClientComms.last_response = packet.content
+                        request = ClientComms.pending_requests.get(packet.req_id)
+
+                        if request:  # The request may have already timed out and removed itself.
+                            response_event, response = request
+                            response.append(packet.content)
+                            response_event.set()
 
                     case PacketTypes.GAME_EVENT:
-                        log("Received game event:", packet.content)
+                        logger.debug("Received game event: %s", packet.content)
                         ClientComms.game_event_queue.append(packet.content)
 
         except (ConnectionResetError, TimeoutError, OSError, EOFError) as e:
@@ -114,60 +155,83 @@ class ClientComms:
             return
 
         try:
-            packets.send_packet(ClientComms.client_socket, packet)
+            with ClientComms.send_lock:
+                packets.send_packet(ClientComms.client_socket, packet)
 
         except (ConnectionResetError, TimeoutError) as e:
             log(f"Failed to send packet: {e}")
             ClientComms.disconnect()
 
     @staticmethod
-    def send_request(command: str) -> Generator[app_async.ThreadWaiter or float, str, str]:
+    def queue_packet(packet: packets.Packet):
+        """
+        Queue a packet to be sent on the next `flush_packets` call, instead of sending it right away.
+        """
+        if ClientComms.online:
+            ClientComms.outbound_queue.append(packet)
+
+    @staticmethod
+    def flush_packets():
+        """
+        Send all the queued packets. Called once every frame by the app.
+
+        When more than one packet is queued, the packets are wrapped into a single batch packet so that they are sent
+        with one header and one pickle.
+        """
+        if not ClientComms.outbound_queue:
+            return
+
+        if len(ClientComms.outbound_queue) == 1:
+            packet = ClientComms.outbound_queue.popleft()
+        else:
+            packet = Packet(PacketTypes.BATCH, content=list(ClientComms.outbound_queue))
+            ClientComms.outbound_queue.clear()
+
+        ClientComms.send_packet(packet)
+
+    @staticmethod
+    def send_request(command: str) -> Generator[app_async.ThreadWaiter or app_async.EventWaiter, str, str]:
         """
         Send a basic request packet to the server and wait for the response.
 
-        :param command:
-        :return:
+        Every request has its own ID and response event, so multiple requests can wait for their responses at the same
+        time. The response event is set by the receive thread when the response with the matching ID arrives.
+
+        :param command: The request command, e.g. "join ABCD".
+        :return: The response of the server, or a string starting with "ERROR" if there is no response.
         """
         if not ClientComms.online:
             return ""
 
-        check_delay = 0.05
-
-        req_time = time.time_ns()
-        ClientComms.request_queue.append(req_time)
+        req_id = next(ClientComms.request_ids)
+        connection_number = ClientComms.connection_number
+        response_event = threading.Event()
+        response: list[str] = []
+        ClientComms.pending_requests[req_id] = response_event, response
 
         # FIXME when client gets disconnected from server because of the server shutting down, it can't join again for
         #  some reason haiya, idk the `run_as_serial_coroutine` decorator thingy may be the culprit though
 
-        # Wait until it's the call's turn on the request queue.
-        while ClientComms.request_queue[0] != req_time:
-            yield check_delay
-
         # Send request
-        send_task = app_async.ThreadWaiter(ClientComms.send_packet, (Packet(PacketTypes.BASIC_REQUEST, content=command),))
+        send_task = app_async.ThreadWaiter(ClientComms.send_packet,
+                                           (Packet(PacketTypes.BASIC_REQUEST, content=command, req_id=req_id),))
         yield send_task
 
-        # Wait for response
-        wait_time = 0
-
-        while not ClientComms.last_response:
-            wait_time += check_delay
-            yield check_delay
+        # Wait for response: the coroutine checks the response event on every tick, and stops waiting once the receive
+        # thread sets it or once the request times out.
+        yield app_async.EventWaiter(response_event, RESPONSE_TIMEOUT)
 
-            if wait_time >= 3:
-                ClientComms.request_queue.pop(0)
-                ClientComms.last_response = ""
-                log(f"Request: {command} -> Timed out: the server did not send back a basic response.")
-                return "ERROR timeout"
+        ClientComms.pending_requests.pop(req_id, None)
 
-        response = ClientComms.last_response
-        log(f"Request: {command} -> Response: {response}")
+        if not response:
+            if connection_number != ClientComms.connection_number:
+                return "ERROR disconnected"  # The request was made before the client reconnected.
 
-        # Pop the queue and reset the last response
-        ClientComms.request_queue.pop(0)
-        ClientComms.last_response = ""
+            log(f"Request: {command} -> Timed out: the server did not send back a basic response.")
+            return "ERROR timeout"
 
-        return response
+        log(f"Request: {command} -> Response: {response[0]}")
+        return response[0]
 
     @staticmethod
     def is_in_multiplayer() -> bool:
@@ -19,6 +19,9 @@ GAME_SYNC = {
 }
 # `PokerGame` attributes to sync according to the type of game event.
 
+GAME_SYNC_CODES: frozenset[int] = frozenset(GAME_SYNC)
+# The codes of game events that are sent as game sync events. Used for membership tests on every game event.
+
 HAND_SYNC = ["players", "winners", "pots", "community_cards", "current_round_bets"]  # `Hand` attributes to sync.
 PLAYER_SYNC = ["name", "chips", "player_number"]  # `Player` attributes to sync.
 
@@ -26,12 +29,21 @@ PHAND_SYNC = ["pot_eligibility", "folded", "all_in"]  # `PlayerHand` attributes
 PHAND_SYNC_SHOWDOWN = ["pocket_cards", "hand_ranking", "winnings", "pots_won"]  # Extra `PlayerHand` attributes to sync on showdown events.
 PHAND_SYNC_MIDGAME = ["current_round_spent", "last_action"]  # Extra `PlayerHand` attributes to sync on join mid-game events.
 
+PHAND_SYNC_BY_CODE = {
+    GameEvent.SHOWDOWN:      PHAND_SYNC + PHAND_SYNC_SHOWDOWN,
+    GameEvent.JOIN_MID_GAME: PHAND_SYNC + PHAND_SYNC_MIDGAME,
+}
+# The full `PlayerHand` attribute lists for the types of game events that sync extra attributes. Other game events only
+# sync `PHAND_SYNC`.
+
 
 @dataclass
 class GameSyncEvent:
     """
     The `GameSyncEvent` dataclass is used to sync the client-sided `MultiplayerGame` with the server-sided `ServerGameRoom`.
     """
+    KIND = 1  # See `GameEvent.KIND`.
+
     code: int
     attr_dict: dict[str, Any]
 
@@ -75,7 +87,7 @@ def dump_game_sync_data(game: PokerGame, game_event_code) -> GameSyncEvent:
     :param game_event_code: The game event code representing the type of event.
     :return: The GameSyncEvent object containing the attribute dict and additional stuff.
     """
-    if game_event_code not in GAME_SYNC:
+    if game_event_code not in GAME_SYNC_CODES:
         raise ValueError(f"a game event of type {game_event_code} cannot be a game sync event")
 
     attr_list = GAME_SYNC[game_event_code]
@@ -87,12 +99,7 @@ def dump_game_sync_data(game: PokerGame, game_event_code) -> GameSyncEvent:
     if "hand" in attr_list:
         attr_dict["hand"] = dump_select_attrs(game.hand, HAND_SYNC, ["players"])
 
-        phand_sync_attrs = PHAND_SYNC
-        if game_event_code == GameEvent.SHOWDOWN:
-            phand_sync_attrs += PHAND_SYNC_SHOWDOWN
-        elif game_event_code == GameEvent.JOIN_MID_GAME:
-            phand_sync_attrs += PHAND_SYNC_MIDGAME
-
+        phand_sync_attrs = PHAND_SYNC_BY_CODE.get(game_event_code, PHAND_SYNC)
         attr_dict["hand"]["players"] = [dump_select_attrs(player, phand_sync_attrs) for player in game.hand.players]
 
     return GameSyncEvent(game_event_code, attr_dict)
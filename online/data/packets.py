@@ -2,7 +2,15 @@ import pickle
 from dataclasses import dataclass
 import socket
 import struct
-from typing import Any
+from typing import Any, BinaryIO
+
+
+HEADER = struct.Struct("<I")
+"""The packet length header: a 4 byte little-endian unsigned int. The format is compiled once and reused for every
+packet."""
+
+HEADER_SIZE = HEADER.size
+"""The size of the packet length header in bytes."""
 
 
 class PacketTypes:
@@ -12,33 +20,86 @@ class PacketTypes:
     GAME_ACTION = 2
     GAME_EVENT = 3
 
+    BATCH = 4  # The content is a list of packets, to be handled in order.
+
 
 @dataclass
 class Packet:
     packet_type: int
     content: Any = None
+    req_id: int = 0  # Basic requests and their responses share the same request ID, set by the client.
 
 
-def send_packet(s: socket.socket, packet: Packet) -> None:
+def pack_packet(packet: Packet) -> bytes:
     """
-    Send a packet through a socket.
+    Pickle a packet and prefix it with its length header, ready to be sent through a socket. A packet that is sent to
+    multiple sockets can be packed once and sent with `sendall`.
     """
     packet_raw = pickle.dumps(packet)
-    packet_len_raw = struct.pack("i", len(packet_raw))
+    return HEADER.pack(len(packet_raw)) + packet_raw
+
+
+def send_packet(s: socket.socket, packet: Packet) -> None:
+    """
+    Send a packet through a socket. The length header and the pickled packet are sent together in one `sendall` call, so
+    the packet is never partially sent.
+    """
+    s.sendall(pack_packet(packet))
+
+
+def recv_exact(s: socket.socket, n: int) -> bytearray or None:
+    """
+    Receive exactly `n` bytes from the given socket, calling `recv_into` until the whole buffer is filled.
+
+    :return: The received bytes, or None if the connection was closed before all the bytes arrived.
+    """
+    buffer = bytearray(n)
+    view = memoryview(buffer)
+    received = 0
 
-    # print("Send packet", packet_raw)
-    s.send(packet_len_raw)
-    s.send(packet_raw)
+    while received < n:
+        count = s.recv_into(view[received:])
+        if not count:
+            return None
+
+        received += count
+
+    return buffer
 
 
 def receive_packet(s: socket.socket) -> Packet or None:
     """
     Receive a packet from the given socket.
+
+    :return: The packet, or None if the connection has been closed.
+    """
+    header = recv_exact(s, HEADER_SIZE)
+    if header is None:
+        return None
+
+    packet_len: int = HEADER.unpack(header)[0]
+    packet_raw = recv_exact(s, packet_len)
+    if packet_raw is None:
+        return None
+
+    return pickle.loads(packet_raw)
+
+
+def read_packet(reader: BinaryIO) -> Packet or None:
     """
-    try:
-        packet_len: int = struct.unpack("i", s.recv(4))[0]
-        packet: Packet = pickle.loads(s.recv(packet_len))
-        return packet
+    Receive a packet from a buffered binary reader of a socket (made with `socket.makefile("rb")`). Unlike
+    `receive_packet`, the header and the whole packet are always read in full, and small packets that arrive together
+    are read from the reader's buffer without a `recv` call for each read.
 
-    except struct.error:
+    :return: The packet, or None if the connection has been closed.
+    """
+    header = reader.read(HEADER_SIZE)
+    if len(header) < HEADER_SIZE:
         return None
+
+    packet_len: int = HEADER.unpack(header)[0]
+    packet_raw = reader.read(packet_len)
+    if len(packet_raw) < packet_len:
+        return None
+
+    return pickle.loads(packet_raw)
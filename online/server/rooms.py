@@ -1,7 +1,9 @@
+import dataclasses
 import threading
+from collections import deque
 
-from online.data.game_sync import GameSyncEvent, dump_game_sync_data, GAME_SYNC
-from online.data.packets import send_packet, PacketTypes, Packet
+from online.data.game_sync import GameSyncEvent, dump_game_sync_data, GAME_SYNC_CODES
+from online.data.packets import pack_packet, PacketTypes, Packet
 from rules.game_flow import Player, PokerGame, GameEvent, Actions
 
 from typing import TYPE_CHECKING
@@ -27,10 +29,13 @@ class HandlerPlayer(Player):
                 threading.Timer(0.5, self.action, (Actions.FOLD,)).start()
             return
 
+        self.game: ServerGameRoom
+        event_data = self.game.get_event_data(game_event)
+
         # For some types of game events, send a game data packet.
-        if game_event.code in GAME_SYNC:
-            game_sync_event: GameSyncEvent = dump_game_sync_data(self.game, game_event.code)
-            game_sync_event.client_player_number = self.player_number
+        if game_event.code in GAME_SYNC_CODES:
+            # The game data is shared by every player, only the client specific fields are set on a copy.
+            game_sync_event: GameSyncEvent = dataclasses.replace(event_data, client_player_number=self.player_number)
 
             if game_event.code == GameEvent.NEW_HAND:
                 game_sync_event.client_pocket_cards = self.player_hand.pocket_cards
@@ -38,8 +43,8 @@ class HandlerPlayer(Player):
             self.client.send_packet(Packet(PacketTypes.GAME_EVENT, game_sync_event))
 
         else:
-            # Forward the game event to the client by sending a game event packet.
-            self.client.send_packet(Packet(PacketTypes.GAME_EVENT, game_event))
+            # Forward the game event to the client by sending the game event packet, which is only packed once.
+            self.client.send_packed_packet(event_data)
 
 
 class ServerGameRoom(PokerGame):
@@ -52,9 +57,12 @@ class ServerGameRoom(PokerGame):
         self.sb_amount = 25  # Attribute of PokerGame
 
         # List of non-participating players
-        self.joining_queue: list[HandlerPlayer] = []
+        self.joining_queue: deque[HandlerPlayer] = deque()
         self.spectators: list[HandlerPlayer] = []
 
+        self.event_cache: tuple[GameEvent, GameSyncEvent or bytes] or None = None
+        """The last game event sent to the players, along with the data that is sent for it (see `get_event_data`)."""
+
     def join(self, client: "ClientHandler") -> HandlerPlayer or None:
         """
         Create a new `HandlerPlayer` for the given client handler to join the room.
@@ -116,6 +124,24 @@ class ServerGameRoom(PokerGame):
         client.current_player.leave_next_hand = True
         client.current_player.client = None
 
+    def get_event_data(self, game_event: GameEvent) -> GameSyncEvent or bytes:
+        """
+        Get the data that is sent to the players for a game event: the game sync event for game sync codes, or else the
+        packed game event packet. The data is only made once per game event, and reused for the rest of the players
+        that the event is broadcast to.
+        """
+        event_cache = self.event_cache
+        if event_cache and event_cache[0] is game_event:
+            return event_cache[1]
+
+        if game_event.code in GAME_SYNC_CODES:
+            event_data = dump_game_sync_data(self, game_event.code)
+        else:
+            event_data = pack_packet(Packet(PacketTypes.GAME_EVENT, game_event))
+
+        self.event_cache = game_event, event_data
+        return event_data
+
     def time_next_event(self, event):
         match event.code:
             case GameEvent.RESET_PLAYERS:
@@ -155,7 +181,7 @@ class ServerGameRoom(PokerGame):
         """
         Broadcast the event to the non-participating players (clients who are in the room but aren't playing the game).
         """
-        for player in self.spectators + self.joining_queue:
+        for player in (*self.spectators, *self.joining_queue):
             player.receive_event(event)
 
     def prepare_next_hand(self, cycle_dealer=True) -> bool:
@@ -175,7 +201,7 @@ class ServerGameRoom(PokerGame):
             should_reset_players = True
 
         while self.joining_queue and len(self.players) < self.max_players:
-            self.players.append(self.joining_queue.pop(0))
+            self.players.append(self.joining_queue.popleft())
             self.players[-1].player_number = len(self.players) - 1
 
         return should_reset_players
@@ -44,6 +44,8 @@ class ClientHandler(socketserver.BaseRequestHandler):
 
     def handle(self):
         threading.current_thread().name = f"Client {self.client_address[0]}:{self.client_address[1]}"
+        # Game packets are small, so they are sent right away instead of being held back by Nagle's algorithm.
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         self.server: AllinServer
         self.server.clients.append(self)
 
@@ -80,48 +82,57 @@ class ClientHandler(socketserver.BaseRequestHandler):
                 if self.current_player:
                     self.current_player.action(*packet.content)
 
+            case PacketTypes.BATCH:
+                for sub_packet in packet.content:
+                    self.handle_packet(sub_packet)
+
     def handle_basic_request(self, packet: packets.Packet):
-        if type(packet.content) is not str:
-            self.send_basic_response("ERROR contents of a basic request packet must be a string")
-            return
+        self.send_basic_response(self.process_basic_request(packet.content), packet.req_id)
 
-        log(f"Received basic request: {packet.content}")
+    def process_basic_request(self, content: Any) -> str:
+        """
+        Carry out a basic request and return the response to be sent back to the client.
+        """
+        if type(content) is not str:
+            return "ERROR contents of a basic request packet must be a string"
+
+        log(f"Received basic request: {content}")
 
         try:
-            sep = packet.content.index(" ")
-            req_type, req_args = packet.content[:sep], packet.content[sep + 1:]
+            sep = content.index(" ")
+            req_type, req_args = content[:sep], content[sep + 1:]
         except ValueError:  # No space in command
-            req_type, req_args = packet.content, ""
+            req_type, req_args = content, ""
 
         match req_type:
             case "echo":
-                self.send_basic_response(req_args)
+                return req_args
 
             case "public":
-                self.send_basic_response("here are some public rooms bruv: <list of rooms>")
+                return "here are some public rooms bruv: <list of rooms>"
 
             case "code":
-                self.send_basic_response(f"here is some info regarding the room with code {req_args}: <some room info>")
+                return f"here is some info regarding the room with code {req_args}: <some room info>"
 
             case "join":
-                # self.send_basic_response(f"you joined room {req_args}")
+                # return f"you joined room {req_args}"
                 try:
                     self.join_room(req_args)
-                    self.send_basic_response("SUCCESS")
+                    return "SUCCESS"
 
                 except (ValueError, KeyError) as e:
                     log(f"Failed to join room: {e}", symbol="X")
-                    self.send_basic_response(f"ERROR failed to join room: {e}")
+                    return f"ERROR failed to join room: {e}"
 
             case "leave":
                 self.leave_room()
-                self.send_basic_response("SUCCESS")
+                return "SUCCESS"
 
             case _:
-                self.send_basic_response("ERROR invalid request command")
+                return "ERROR invalid request command"
 
-    def send_basic_response(self, content: Any) -> int:
-        return self.send_packet(Packet(PacketTypes.BASIC_RESPONSE, content=content))
+    def send_basic_response(self, content: Any, req_id: int = 0) -> int:
+        return self.send_packet(Packet(PacketTypes.BASIC_RESPONSE, content=content, req_id=req_id))
 
     def send_packet(self, packet: Packet) -> int:
         try:
@@ -131,6 +142,17 @@ class ClientHandler(socketserver.BaseRequestHandler):
             log("Failed to send packet:", packet, symbol="X")
             return 1
 
+    def send_packed_packet(self, packed_packet: bytes) -> int:
+        """
+        Send a packet that has already been packed with `packets.pack_packet`.
+        """
+        try:
+            self.request.sendall(packed_packet)
+            return 0
+        except (OSError, TimeoutError, ConnectionResetError, socket.error):
+            log("Failed to send packed packet.", symbol="X")
+            return 1
+
 
     def join_room(self, room_code: str):
         self.server: AllinServer
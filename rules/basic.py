@@ -67,6 +67,25 @@ def generate_deck() -> list:
     return deck
 
 
+def straight_top(rank_mask: int) -> int:
+    """
+    Finds the highest card of the best straight in a rank bitmask, where bit r is set if a card of rank r is present.
+
+    :return: The rank of the highest card of the straight; 0 if there is no straight.
+    """
+    rank_mask |= (rank_mask >> 13) & 0b10  # Aces can either be in the lowest or the highest card on a straight
+    run = rank_mask & (rank_mask << 1) & (rank_mask << 2) & (rank_mask << 3) & (rank_mask << 4)
+    return run.bit_length() - 1 if run else 0
+
+
+def straight_ranks(top: int) -> list[int]:
+    """
+    Returns the ranks of a straight from the lowest, given the highest card of the straight. On the lowest possible
+    straight (5 high), the ace comes first.
+    """
+    return [rank if rank > 1 else 14 for rank in range(top - 4, top + 1)]
+
+
 """
 =====================
 II. HandRanking class
@@ -169,19 +188,28 @@ class HandRanking:
 
         """
         1. Count cards based on the rank and suit
+
+        Instead of dicts, the cards are packed into integers. `rank_counts` holds a 4-bit counter for every rank, where
+        the count of rank r sits at bits 4r to 4r+3. `suit_masks` holds a rank bitmask for every suit, where bit r is set
+        if there is a card of rank r with that suit.
         """
         # region Step 1
-        rank_count = {}  # The number of cards for a certain rank. Structure: {rank: number of cards of that rank}
-        suit_count = {}  # The number of cards for a certain suit. Structure: {suit: number of cards of that suit}
+        rank_counts = 0
+        suit_masks = dict.fromkeys("SHDC", 0)
 
         for card in self.cards:
-            rank_count[card.rank] = rank_count.setdefault(card.rank, 0) + 1
-            suit_count[card.suit] = suit_count.setdefault(card.suit, 0) + 1
+            rank_counts += 1 << (card.rank << 2)
+            suit_masks[card.suit] |= 1 << card.rank
 
-        sorted_rank_count = sorted(rank_count.items(), key=lambda x: (x[1] << 4) + x[0], reverse=True)
+        rank_mask = suit_masks["S"] | suit_masks["H"] | suit_masks["D"] | suit_masks["C"]
+        # A bitmask of all the available ranks
+
+        sorted_rank_count = sorted(((rank, (rank_counts >> (rank << 2)) & 0xF) for rank in range(2, 15)
+                                    if rank_mask >> rank & 1),
+                                   key=lambda x: (x[1] << 4) + x[0], reverse=True)
         """
-        `sorted_rank_count` is a list of tuples from `rank_count.items()` dict. The (rank, rank count) pairs/tuples
-        are sorted from the highest rank count, then the same rank counts are sorted from the highest rank.
+        `sorted_rank_count` is a list of (rank, rank count) tuples. The tuples are sorted from the highest rank count,
+        then the same rank counts are sorted from the highest rank.
 
         To do so, the key of the sorting is `lambda x: (x[1] << 4) + x[0]` as seen above. The rank count (x[1]) is bit
         shifted 4 bits to the left (multiplied by 16) and then added by the rank (x[0]) so that the tuples are sorted
@@ -233,85 +261,32 @@ class HandRanking:
         * Straight flush
         * Royal flush
 
-        Straights are detected by creating a list of all the ranks sorted from the lowest, and then performing a linear
-        scan to determine if there are 5 consecutive cards in a row or not.
-
-        After detecting 5 consecutive cards, the program determines if those cards is a royal flush, straight flush, or
-        just a regular straight; then those 5 cards are saved to the ranked cards list and the highest rank is saved as
-        a tiebreaker score.
+        Straights are detected on a rank bitmask with `straight_top`: the bitmask is ANDed with itself shifted by 1 to 4
+        bits, which leaves a bit r set only if the ranks r-4 until r are all present. The highest remaining bit is the
+        highest card of the best straight.
 
-        If a sequence of 5 cards has already been found earlier, then the hand ranking, ranked cards, and tiebreaker
-        score is only updated if the new hand is better than the previous one. This scenario can happen when there is a
-        sequence of more than 5 cards (e.g. 3, 4, 5, 6, 7, 8).
+        Straight flushes are detected the same way, but on the bitmask of each suit instead of all the ranks. A straight
+        flush always beats the rank count based rankings, while a regular straight only replaces a worse ranking.
         """
         # region Step 3
-        sorted_ranks = sorted(rank_count.keys())  # A sorted list of all the available ranks
-
-        if 14 in sorted_ranks:
-            sorted_ranks.insert(0, 1)  # Aces can either be in the lowest or the highest card on a straight
-
-        if len(sorted_ranks) >= 5:
-            consecutives = [sorted_ranks[0]]
-            # A list containing the rank of cards that are in consecutive order. If the next number on the sorted ranks
-            # list breaks the sequence, then the consecutives list is reset.
-
-            for x, y in zip(sorted_ranks[:-1], sorted_ranks[1:]):
-                """
-                Do a linear scan through the `sorted_ranks` list with 2 elements at a time. After a straight is found,
-                the loop still continues because there may be another straight with a higher card.
-                """
-                if x + 1 == y:
-                    consecutives.append(y)
-                else:
-                    consecutives = [y]
-
-                if len(consecutives) >= 5:
-                    """
-                    If there are 5 cards with consecutive ranks, then it is a straight. The next step is to determine if
-                    the straight is a straight flush, royal flush, or just a regular straight.
-                    """
-                    if len(consecutives) >= 6:
-                        consecutives.pop(0)
-
-                    if consecutives[0] == 1:
-                        # If the first card of the straight is an ace (the lowest possible straight) then change the
-                        # rank integer from 1 back to 14
-                        consecutives[0] = 14
-
-                    # Determine the suit(s) of each rank in the straight sequence.
-                    straight_suits = {rank: [] for rank in consecutives}
-                    for card in self.cards:
-                        if card.rank in straight_suits:
-                            straight_suits[card.rank].append(card.suit)
-
-                    matcher_suit = next(suits for suits in straight_suits.values() if len(suits) == 1)[0]
-                    """`matcher_suit` is the suit of one of the cards in the straight cards. The suits of the other
-                    cards on the straight sequence are then matched with the matcher suit, and if all of them match the
-                    matcher suit, then it is a straight flush or royal flush.
-
-                    The matcher suit is chosen by taking the first rank in the sequence that only consists of a single
-                    suit."""
-
-                    for suits in straight_suits.values():
-                        if matcher_suit not in suits:
-                            self.ranking_type = min(self.ranking_type, HandRanking.STRAIGHT)
-
-                            if self.ranking_type == HandRanking.STRAIGHT:
-                                self.tiebreaker_score = y
-                                self.ranked_cards = [next(card for card in self.cards if card.rank == rank)
-                                                     for rank in consecutives]
-                            break
-
-                    else:
-                        if y == 14:
-                            self.ranking_type = HandRanking.ROYAL_FLUSH
-                        else:
-                            self.ranking_type = HandRanking.STRAIGHT_FLUSH
-
-                        self.tiebreaker_score = y
-                        self.ranked_cards = [next(card for card in self.cards
-                                                  if card.rank == rank and card.suit == matcher_suit)
-                                             for rank in consecutives]
+        flush_straight_top, flush_straight_suit = max((straight_top(mask), suit) for suit, mask in suit_masks.items())
+
+        if flush_straight_top:
+            if flush_straight_top == 14:
+                self.ranking_type = HandRanking.ROYAL_FLUSH
+            else:
+                self.ranking_type = HandRanking.STRAIGHT_FLUSH
+
+            self.tiebreaker_score = flush_straight_top
+            self.ranked_cards = [next(card for card in self.cards
+                                      if card.rank == rank and card.suit == flush_straight_suit)
+                                 for rank in straight_ranks(flush_straight_top)]
+
+        elif (top := straight_top(rank_mask)) and self.ranking_type > HandRanking.STRAIGHT:
+            self.ranking_type = HandRanking.STRAIGHT
+
+            self.tiebreaker_score = top
+            self.ranked_cards = [next(card for card in self.cards if card.rank == rank) for rank in straight_ranks(top)]
         # endregion Step 3
 
         """
@@ -321,13 +296,14 @@ class HandRanking:
         `self.ranking_type`) has already been found, then there is no need to detect for a flush.
         """
         # region Step 4
-        if self.ranking_type > HandRanking.FLUSH and any(x >= 5 for x in suit_count.values()):
-            self.ranking_type = HandRanking.FLUSH
-
-            flush_suit = next(suit for suit in suit_count if suit_count[suit] >= 5)
-            self.ranked_cards = sorted([card for card in self.cards if card.suit == flush_suit], reverse=True)[:5]
-            # The ranked cards list is sorted from the highest cards with the flush suit (the suit with 5 or more
-            # cards). Only the 5 highest cards are saved.
+        if self.ranking_type > HandRanking.FLUSH:
+            flush_suit = next((suit for suit, mask in suit_masks.items() if mask.bit_count() >= 5), None)
+
+            if flush_suit:
+                self.ranking_type = HandRanking.FLUSH
+                self.ranked_cards = sorted([card for card in self.cards if card.suit == flush_suit], reverse=True)[:5]
+                # The ranked cards list is sorted from the highest cards with the flush suit (the suit with 5 or more
+                # cards). Only the 5 highest cards are saved.
 
         # endregion Step 4
 
@@ -30,7 +30,7 @@ class ActionResult:
     HAND_NOT_STARTED_YET = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class GameEvent:
     """
     A game event is used to pass information from an ongoing game/hand to the `Player.receive_event` method and the
@@ -52,6 +52,8 @@ class GameEvent:
     RESET_PLAYERS = 9
     JOIN_MID_GAME = 10
 
+    KIND = 0  # Tag used to tell apart a `GameEvent` from a `GameSyncEvent` (online/data/game_sync.py) in event queues.
+
     # Class fields
     code: int
     prev_player: int = -1
@@ -69,6 +71,8 @@ class Player:
     game.
     """
 
+    __slots__ = ("game", "player_hand", "leave_next_hand", "name", "chips", "player_number")
+
     def __init__(self, game: "PokerGame", name: str, chips: int):
         self.game: "PokerGame" = game
         self.player_hand: Optional["PlayerHand"] = None
@@ -108,6 +112,9 @@ class PlayerHand:
     are disposed of.
     """
 
+    __slots__ = ("hand", "player_data", "pocket_cards", "hand_ranking", "current_round_spent", "last_action",
+                 "pot_eligibility", "winnings", "pots_won", "folded", "called", "all_in")
+
     def __init__(self, hand: "Hand", player_data: Player):
         self.hand: "Hand" = hand
         self.player_data: "Player" = player_data
@@ -174,6 +181,9 @@ class Hand:
     After a hand ends, the old hand is deleted and another hand starts, but the game `PokerGame` is still the same.
     """
 
+    __slots__ = ("game", "players", "winners", "pots", "current_round_bets", "amount_to_call", "community_cards", "deck",
+                 "current_turn", "blinds", "round_finished", "hand_started", "skip_next_rounds")
+
     def __init__(self, game: "PokerGame"):
         """
         Initialize the fields of a hand, notably the `PlayerHand` objects and their pocket cards. After initializing the
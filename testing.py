@@ -11,6 +11,7 @@ from rules.game_flow import *
 
 # Comment the imports below unless you want to run the server request test.
 import app
+from app.tools import app_timer
 from online.client.client_comms import ClientComms
 
 
@@ -302,6 +303,58 @@ def hand_ranking_test(n_tests=10, repeat_until=0):
     print("Repeats:", i)
 
 
+def timer_group_test(minutes=5, seed=0, max_updates_per_tick=1000):
+    """
+    Drive a `TimerGroup` with millisecond frame times for a few minutes of game time, using the delays the game actually
+    uses. Fails if a timer gets updated too many times within a single tick, which means the wake heap is spinning on a
+    timer whose wake time doesn't move forward.
+    """
+    rng = random.Random(seed)
+    delays = [0.5, 1, 2, 3, 10] + [2.25 + k / 8 for k in range(6)]
+    updates_this_tick = 0
+    fired = 0
+
+    class CountingTimer(app_timer.Timer):
+        def update(self, dt):
+            nonlocal updates_this_tick
+            updates_this_tick += 1
+            assert updates_this_tick <= max_updates_per_tick, f"timer group is spinning: dt={dt}, " \
+                                                              f"delay_left={self.delay_left}"
+            super().update(dt)
+
+    def respawn():
+        nonlocal fired
+        fired += 1
+        CountingTimer(rng.choice(delays), respawn, group=group)
+
+    # A timer whose wake time lands exactly on the group clock, but whose elapsed time rounds to slightly less than its
+    # delay, leaving a delay left too small to move its wake time forward.
+    group = app_timer.TimerGroup()
+    group.update(63.15454644541692)
+    edge_timer = CountingTimer(2.375, lambda: None, group=group)
+    group.update(0)
+
+    for dt in (2.375, 0.016):
+        updates_this_tick = 0
+        group.update(dt)
+
+    assert edge_timer.finished, "the timer left with a rounding error sized delay never fired"
+
+    # Timers with the game's delays on a long running clock.
+    group = app_timer.TimerGroup()
+    for _ in range(10):
+        respawn()
+
+    game_time = 0
+    while game_time < minutes * 60:
+        updates_this_tick = 0
+        dt = rng.choice((16, 17, 33)) / 1000
+        group.update(dt)
+        game_time += dt
+
+    print(f"Timer group test passed: {fired} timers fired in {minutes} minutes of game time.")
+
+
 def server_request_test():
     ClientComms.connect(threaded=False)
 
@@ -322,6 +375,9 @@ def attributes_thingy():
         for k, v in d.items():
             print("{:30} {}".format(k, v))
 
+    def slots_dict(o: object) -> dict:
+        return {attr: getattr(o, attr) for attr in type(o).__slots__}
+
     game = PokerGame()
     game.players = [Player(game, "aaa", 727), Player(game, "bbb", 69)]
 
@@ -333,18 +389,19 @@ def attributes_thingy():
     print_dict(vars(game))
 
     print("\nHand attributes:\n")
-    print_dict(vars(hand))
+    print_dict(slots_dict(hand))
 
     print("\nPlayer attributes:\n")
-    print_dict(vars(player))
+    print_dict(slots_dict(player))
 
     print("\nPlayerHand attributes:\n")
-    print_dict(vars(player_hand))
+    print_dict(slots_dict(player_hand))
 
 
 if __name__ == "__main__":
     # standard_io_poker()
     # server_request_test()
+    # timer_group_test()
     attributes_thingy()
     # hand_ranking_test(repeat_until=HandRanking.ROYAL_FLUSH)
     # hand_ranking_test(n_tests=25)